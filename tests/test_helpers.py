@@ -19,6 +19,7 @@ from typing import List
 import numpy as np
 import pytest
 
+from uim.codec.parser.decoder.base import CodecDecoder
 from uim.model import UUIDIdentifier
 from uim.model.base import Identifier
 from uim.model.helpers.boundingbox import union, union_all
@@ -198,3 +199,15 @@ def test_uuid():
     uuid_2_obj: uuid.UUID = UUIDIdentifier.str_to_uimid(uuid_2_str)
     id_h_form: str = str(uuid_2_obj)
     assert uuid_2_str == id_h_form
+
+
+@pytest.mark.parametrize('num_values', [0, 1, 16, CodecDecoder.VECTORIZE_THRESHOLD + 1])
+def test_decode_vectorized(num_values: int):
+    values: List[int] = [(i * 37) % 101 - 50 for i in range(num_values)]
+    sequential: List[float] = []
+    last: float = 12.5 / 100.
+    for v in values:
+        last += v / 100.
+        sequential.append(last)
+    assert CodecDecoder.__decode__(values, precision=2, start_value=12.5) == sequential
+    assert CodecDecoder.__decode__(np.asarray(values), precision=2, start_value=12.5) == sequential
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# Copyright © 2024-present Wacom Authors. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import warnings
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+import pytest
+from lxml import etree
+
+from uim.codec.parser.inkml import InkMLParser, InkMLParserException
+from uim.codec.parser.iotpaper import IOTPaperParser
+from uim.codec.parser.uim import UIMParser
+from uim.codec.writer.encoder.encoder_3_1_0 import UIMEncoder310
+from uim.model.ink import InkModel
+from uim.model.semantics.schema import MathStructureSchema
+
+# Test data directory
+test_data_dir: Path = Path(__file__).parent / '../ink/'
+
+DIFFERENCE_ENCODED: bytes = b"""<ink xmlns="http://www.w3.org/2003/InkML">
+<trace>10 20 100, 11 22 101, 13 25 102, 13 25 102</trace>
+<trace>10 20 100, '1 '2 '1, '2 '3 '1, !13 25 102</trace>
+<trace>10 20 100, "1 "2 "1, "1 "1 "0, !13 25 102</trace>
+<trace>10 20 100, '1 '2 '1, 2 3 1, !13 25 102</trace>
+</ink>"""
+
+NESTED_TRACE_GROUPS: bytes = b"""<ink xmlns="http://www.w3.org/2003/InkML">
+<traceGroup><trace>1 2, 3 4</trace><traceGroup><trace>1 2, 3 5</trace><traceGroup><trace>2 2, 3 4</trace>
+</traceGroup></traceGroup><traceGroup><trace>1 1, 3 4</trace></traceGroup></traceGroup>
+</ink>"""
+
+LATE_CONTEXT: bytes = b"""<definitions><context xml:id="c1"><inkSource xml:id="s1"><traceFormat>
+<channel name="X" type="decimal" units="mm"/><channel name="Y" type="decimal" units="mm"/></traceFormat>
+<channelProperties><channelProperty channel="X" name="resolution" value="100" units="1/mm"/>
+<channelProperty channel="Y" name="resolution" value="100" units="1/mm"/></channelProperties>
+</inkSource></context></definitions>"""
+
+GUESS_PARAMETERS: bytes = b"""<ink xmlns="http://www.w3.org/2003/InkML">
+<definitions><context xml:id="c1"><inkSource xml:id="s1"/></context></definitions>
+<trace>1200 5, 1300 6</trace><traceGroup><trace>250 7, 1 1</trace><traceGroup><trace>100000 8</trace></traceGroup>
+</traceGroup><trace>5000 9</trace>
+</ink>"""
+
+MATHML_ANNOTATION: bytes = b"""<ink xmlns="http://www.w3.org/2003/InkML"><annotationXML encoding="Content-MathML">
+<m:math xmlns:m="http://www.w3.org/1998/Math/MathML">\n\t<m:mi>x</m:mi><b />\r\n</m:math> tail
+</annotationXML><traceGroup><annotation type="truth">x</annotation><trace>1 2, 3 4</trace></traceGroup></ink>"""
+
+LATE_CONTEXT_TRACE: bytes = b'<trace contextRef="#c1">100 200, 110 220</trace>'
+
+
+def test_iot_paper():
+    ink_model: InkModel = IOTPaperParser().parse(test_data_dir / 'iot' / 'HelloInk.paper')
+    assert len(ink_model.strokes) > 0
+    assert len(ink_model.sensor_data.sensor_data) >= len(ink_model.strokes)
+
+
+def test_inkml_difference_encoding():
+    ink_model: InkModel = InkMLParser().parse(DIFFERENCE_ENCODED)
+    explicit, *encoded = ink_model.strokes
+    assert len(encoded) == 3
+    for stroke in encoded:
+        assert stroke.splines_x == pytest.approx(explicit.splines_x)
+        assert stroke.splines_y == pytest.approx(explicit.splines_y)
+
+
+def test_inkml_leading_decimal_point():
+    plain, explicit = InkMLParser().parse(b'<ink xmlns="http://www.w3.org/2003/InkML"><trace>1 2, .5 3</trace>'
+                                          b'<trace>1 2, !.5 3</trace></ink>').strokes
+    assert plain.splines_x == pytest.approx(explicit.splines_x)
+    assert plain.splines_y == pytest.approx(explicit.splines_y)
+
+
+def test_inkml_malformed_values(monkeypatch):
+    fromstring = np.fromstring
+
+    def partial_fromstring(data, *args, **kwargs):
+        # NumPy 1.x warns about unmatched data and returns the values read so far
+        warnings.warn('string or file could not be read to its end', DeprecationWarning)
+        return fromstring(data.split(b'-')[0], *args, **kwargs)
+
+    document: bytes = b'<ink xmlns="http://www.w3.org/2003/InkML"><trace>1 2, 3-4</trace></ink>'
+    expected: InkModel = InkMLParser().parse(document.replace(b'3-4', b'3 -4'))
+    for patched in (False, True):
+        if patched:
+            monkeypatch.setattr(np, 'fromstring', partial_fromstring)
+        ink_model: InkModel = InkMLParser().parse(document)
+        assert ink_model.strokes[0].splines_x == pytest.approx(expected.strokes[0].splines_x)
+        assert ink_model.strokes[0].splines_y == pytest.approx(expected.strokes[0].splines_y)
+
+
+def test_inkml_nested_trace_groups():
+    ink_model: InkModel = InkMLParser().parse(NESTED_TRACE_GROUPS)
+    assert len(ink_model.strokes) == 4
+
+
+def test_inkml_traces_streamed():
+    events = etree.iterparse(BytesIO(DIFFERENCE_ENCODED), events=('start', 'end'))
+    _, root = next(events)
+    namespace: str = InkMLParser.INKML_NAMESPACE
+    traces: list = [len(tr.text) for tr in InkMLParser.__iter_traces__(root, events, namespace)]
+    assert len(traces) == 4
+    assert root.find(f'{namespace}trace') is None
+
+
+def test_inkml_context_after_traces(tmp_path: Path):
+    # The context follows a trace, separated by more data than a single read of the parser
+    annotation: bytes = b'<annotation type="note">' + b'x' * 200000 + b'</annotation>'
+    late: bytes = b''.join([b'<ink xmlns="http://www.w3.org/2003/InkML">', LATE_CONTEXT_TRACE, annotation,
+                            LATE_CONTEXT, b'</ink>'])
+    first: bytes = b''.join([b'<ink xmlns="http://www.w3.org/2003/InkML">', LATE_CONTEXT, LATE_CONTEXT_TRACE,
+                             annotation, b'</ink>'])
+    expected: InkModel = InkMLParser().parse(first)
+    assert expected.strokes[0].splines_x[0] == pytest.approx(3.78, abs=0.01)
+    late_path: Path = tmp_path / 'late.inkml'
+    late_path.write_bytes(late)
+    for source in (late, late_path):
+        ink_model: InkModel = InkMLParser().parse(source)
+        assert len(ink_model.strokes) == 1
+        assert ink_model.strokes[0].splines_x == pytest.approx(expected.strokes[0].splines_x)
+        assert ink_model.strokes[0].splines_y == pytest.approx(expected.strokes[0].splines_y)
+
+
+def test_inkml_annotation_xml_serialization():
+    parser: InkMLParser = InkMLParser()
+    parser.register_type('truth', 'x', 'will:math-structures/0.1/Symbol')
+    ink_model: InkModel = parser.parse(MATHML_ANNOTATION)
+    mathml: list = [s.object for s in ink_model.knowledge_graph.statements
+                    if s.predicate == MathStructureSchema.HAS_MATHML]
+    # Prefixes and namespaces are kept, empty elements are self-closing, the tail is dropped and the whitespace is
+    # normalized
+    assert mathml == ['<m:math xmlns:m="http://www.w3.org/1998/Math/MathML" xmlns="http://www.w3.org/2003/InkML"> '
+                      '<m:mi>x</m:mi><b/> </m:math>']
+
+
+def test_inkml_guess_parameters(tmp_path: Path):
+    path: Path = tmp_path / 'guess.inkml'
+    path.write_bytes(GUESS_PARAMETERS)
+    # Nested traces are considered as well
+    for source in (GUESS_PARAMETERS, BytesIO(GUESS_PARAMETERS), path, str(path)):
+        assert InkMLParser.guess_parameters(source) == (True, 100., 250., 100000.)
+    without_source: bytes = GUESS_PARAMETERS.replace(b'<inkSource xml:id="s1"/>', b'')
+    assert InkMLParser.guess_parameters(without_source) == (False, 100., 250., 100000.)
+
+
+def test_inkml_guess_parameters_no_traces():
+    with pytest.raises(InkMLParserException):
+        InkMLParser.guess_parameters(b'<ink xmlns="http://www.w3.org/2003/InkML"><traceGroup/></ink>')
+
+
+def test_inkml_spline_precision():
+    parser: InkMLParser = InkMLParser()
+    parser.spline_precision = 1
+    ink_model: InkModel = parser.parse(DIFFERENCE_ENCODED)
+    stroke = ink_model.strokes[0]
+    assert stroke.precision_scheme.position_precision == 1
+    assert all(round(x, 1) == x for x in stroke.splines_x)
+    # Quantized coordinates survive the encoding unchanged
+    decoded: InkModel = UIMParser().parse(UIMEncoder310().encode(ink_model))
+    assert decoded.strokes[0].splines_x == stroke.splines_x
@@ -547,3 +547,21 @@ def test_input_and_sensor_context():
     input_context_repo_other.add_environment(environment)
     input_context_repo_other.add_input_provider(InkInputProvider())
     assert input_context_repo != input_context_repo_other
+
+
+def test_add_channels_data():
+    channels: list = [
+        SensorChannel(channel_type=InkSensorType.X, metric=InkSensorMetricType.LENGTH, resolution=1.0),
+        SensorChannel(channel_type=InkSensorType.TIMESTAMP, metric=InkSensorMetricType.TIME, resolution=1.0),
+        SensorChannel(channel_type=InkSensorType.PRESSURE, metric=InkSensorMetricType.FORCE, resolution=1.0)
+    ]
+    values: list = [[1., 2.], [0.5, 0.6], []]
+    sensor_data_bulk: SensorData = SensorData(UUIDIdentifier.id_generator())
+    sensor_data_bulk.add_channels_data(list(zip(channels, values)))
+    sensor_data: SensorData = SensorData(sensor_data_bulk.id)
+    sensor_data.add_data(channels[0], values[0])
+    sensor_data.add_timestamp_data(channels[1], values[1])
+    sensor_data.add_data(channels[2], values[2])
+    assert [c.id for c in sensor_data_bulk.data_channels] == [c.id for c in sensor_data.data_channels]
+    assert sensor_data_bulk.timestamp == sensor_data.timestamp == 500
+    assert sensor_data_bulk == sensor_data
@@ -1069,3 +1069,41 @@ def test_stroke_strided_array():
         InkStrokeAttributeType.SPLINE_GREEN, InkStrokeAttributeType.SPLINE_BLUE
     ]
     stroke.as_strided_array_extended(ink_model, layout=layout_different)
+
+
+def test_stroke_deferred_splines():
+    calls: list = []
+
+    def loader() -> Tuple[List[float], ...]:
+        calls.append(1)
+        return [1., 2.], [3., 4.], [], [0.5, 0.5], [], [], [], [], [], [], []
+
+    stroke: Stroke = Stroke(UUIDIdentifier.id_generator())
+    stroke.__defer_splines__(loader)
+    assert not calls
+    assert stroke.points_count == 2
+    assert stroke.splines_y == [3., 4.]
+    assert stroke.layout_mask == LayoutMask.X.value | LayoutMask.Y.value | LayoutMask.SIZE.value
+    assert len(calls) == 1
+    # Setting a value before the first read must not be overwritten by the deferred values
+    stroke.__defer_splines__(loader)
+    stroke.splines_x = [5.]
+    assert stroke.splines_x == [5.]
+    assert stroke.splines_y == [3., 4.]
+    # Setting all values at once drops the deferred values
+    stroke.__defer_splines__(loader)
+    stroke.__set_splines__(([7.], [8.], [], [], [], [], [], [], [], [], []))
+    assert stroke.splines_x == [7.] and stroke.splines_y == [8.]
+    assert stroke.layout_mask == LayoutMask.X.value | LayoutMask.Y.value
+
+
+def test_stroke_deferred_splines_failure():
+    def broken_loader() -> Tuple[List[float], ...]:
+        raise ValueError('Corrupt spline data')
+
+    stroke: Stroke = Stroke(UUIDIdentifier.id_generator())
+    stroke.__defer_splines__(broken_loader)
+    # A failing decode is reported on every read instead of leaving empty splines behind
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            _ = stroke.splines_x
@@ -12,6 +12,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import json
 from pathlib import Path
 from typing import Dict
 from uuid import UUID
@@ -71,6 +72,15 @@ def test_uim_3_0_0_json(path: Path):
     assert len(ink_model.strokes) <= len(ink_model.sensor_data.sensor_data)
 
 
+def test_uim_3_0_0_json_unknown_fields(tmp_path: Path):
+    content: dict = json.loads(uim_files_json()[0].read_text(encoding='utf-8'))
+    content['unknownField'] = {'value': 1}
+    path: Path = tmp_path / 'unknown_fields.json'
+    path.write_text(json.dumps(content), encoding='utf-8')
+    ink_model: InkModel = UIMParser().parse_json(path)
+    assert len(ink_model.strokes) > 0
+
+
 def test_wrong_path():
     """
     Test parsing a wrong path with UIM parser.
@@ -12,19 +12,25 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
 
 import bitstring
 import pytest
 
+import uim.codec.format.UIM_3_1_0_pb2 as uim_3_1_0
 from uim.codec.base import ContentType, CompressionType
 from uim.codec.context.decoder import DecoderContext
 from uim.codec.context.encoder import EncoderContext
 from uim.codec.parser.base import SupportedFormats, FormatException
+from uim.codec.parser.decoder.decoder_3_1_0 import UIMDecoder310
 from uim.codec.parser.uim import UIMParser
 from uim.codec.writer.encoder.encoder_3_1_0 import UIMEncoder310
 from uim.model import UUIDIdentifier
+from uim.model.base import InkModelException
 from uim.model.ink import InkModel
 from uim.model.inkinput.sensordata import ChannelData
 from uim.model.semantics.schema import CommonViews
@@ -50,6 +56,28 @@ def test_uim_3_1_0_bytes_io(path: Path):
         assert len(ink_model.strokes) > 0
 
 
+def test_uim_3_1_0_decoder_loaded_on_demand():
+    # Checked in a fresh interpreter, the tests have already imported all decoders
+    script: str = ('import sys, uim\n'
+                   'loaded = [m for m in sys.modules if m.startswith("uim.codec.parser.decoder.")]\n'
+                   'assert not loaded, loaded\n'
+                   'from uim.codec.parser.uim import UIMParser\n'
+                   f'UIMParser().parse({str(sorted(uim_files())[0])!r})\n'
+                   'assert "uim.codec.parser.decoder.decoder_3_1_0" in sys.modules\n'
+                   'assert "uim.codec.parser.decoder.decoder_3_0_0" not in sys.modules\n')
+    result: subprocess.CompletedProcess = subprocess.run([sys.executable, '-c', script], capture_output=True,
+                                                         text=True, cwd=Path(__file__).parent.parent)
+    assert result.returncode == 0, result.stderr
+
+
+def test_uim_3_1_0_stream_released():
+    stream: BytesIO = BytesIO(sorted(uim_files())[0].read_bytes())
+    UIMParser().parse(stream)
+    # Chunk views must not be exported anymore, otherwise the stream cannot be resized
+    stream.write(b'\x00')
+    stream.close()
+
+
 @pytest.mark.parametrize('path', uim_files())
 def test_uim_3_1_0(path: Path):
     parser: UIMParser = UIMParser()
@@ -83,6 +111,14 @@ def test_uim_3_1_0(path: Path):
     assert str(ink_model) == str(ink_model_decoded)
 
 
+def test_uim_3_1_0_concurrent():
+    paths: list = sorted(uim_files())
+    expected: list = [len(UIMParser().parse(path).strokes) for path in paths]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        parsed: list = list(executor.map(lambda p: len(UIMParser().parse(p).strokes), paths * 3))
+    assert parsed == expected * 3
+
+
 def test_load_raster():
     """
     Test loading raster data.
@@ -192,3 +228,22 @@ def test_decoder_context():
     assert context.format_version == SupportedFormats.UIM_VERSION_3_1_0.value
     with pytest.raises(ValueError):
         context.stroke_by_identifier(UUIDIdentifier.id_generator().hex)
+
+
+def test_ink_tree_stroke_index_out_of_range():
+    tree: uim_3_1_0.InkTree = uim_3_1_0.InkTree()
+    tree.tree.add(depth=0, groupID=UUIDIdentifier.id_generator().bytes_le)
+    tree.tree.add(depth=1, index=0)
+    context = DecoderContext(version=SupportedFormats.UIM_VERSION_3_1_0.value, ink_model=InkModel())
+    with pytest.raises(FormatException):
+        UIMDecoder310.__parse_ink_tree__(context, tree)
+
+
+def test_ink_data_invalid_stroke_adds_no_strokes():
+    ink_data: uim_3_1_0.InkData = uim_3_1_0.InkData()
+    ink_data.strokes.add(id=UUIDIdentifier.id_generator().bytes_le)
+    ink_data.strokes.add(id=b'\x01\x02\x03')
+    context = DecoderContext(version=SupportedFormats.UIM_VERSION_3_1_0.value, ink_model=InkModel())
+    with pytest.raises(InkModelException):
+        UIMDecoder310.parse_ink_data(context, ink_data)
+    assert context.strokes == []
@@ -12,10 +12,12 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import mmap
 from pathlib import Path
 
 import pytest
 
+from uim.codec.parser.base import Stream, EndOfStream
 from uim.codec.parser.will import WILL2Parser
 from uim.model.ink import InkModel
 
@@ -39,3 +41,20 @@ def test_will(path: Path):
     assert len(ink_model.strokes) > 0
     assert len(ink_model.sensor_data.sensor_data) > 0
     assert len(ink_model.strokes) == len(ink_model.sensor_data.sensor_data)
+
+
+@pytest.mark.parametrize('path', will_files()[:2])
+def test_will_memory_mapped(path: Path):
+    with path.open('rb') as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        parser: WILL2Parser = WILL2Parser()
+        ink_model: InkModel = parser.parse(mm)
+        assert len(ink_model.strokes) == len(WILL2Parser().parse(path).strokes)
+
+
+def test_stream_read_or_none():
+    stream: Stream = Stream(b'\x01\x02\x03')
+    assert bytes(stream.read_or_none(2)) == b'\x01\x02'
+    assert bytes(stream.read_or_none(2)) == b'\x03'
+    assert stream.read_or_none(1) is None
+    with pytest.raises(EndOfStream):
+        stream.read(1)
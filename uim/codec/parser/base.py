@@ -12,11 +12,12 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import mmap
+import os
 from abc import ABC
 from enum import Enum
 from io import BytesIO
-from pathlib import Path
-from typing import Union
+from typing import Union, BinaryIO, Optional
 
 from uim.codec.context.version import Version
 
@@ -60,14 +61,14 @@ class Parser(ABC):
 
     Parser is responsible to parse an ink file .
     """
-    def parse(self, path_or_stream: Union[str, bytes, memoryview, BytesIO, Path]) -> 'InkModel':
+    def parse(self, path_or_stream: Union[str, bytes, memoryview, BytesIO, mmap.mmap, os.PathLike]) -> 'InkModel':
         """
         Parse the content of the ink file to the Universal Ink memory model.
 
         Parameters
         ----------
-        path_or_stream: Union[str, bytes, memoryview, BytesIO, Path]
-            `Path` of file, path as str, stream, or byte array.
+        path_or_stream: Union[str, bytes, memoryview, BytesIO, mmap.mmap, os.PathLike]
+            `Path` of file, path as str, stream, memory-mapped file, or byte array.
 
         Returns
         -------
@@ -76,6 +77,25 @@ class Parser(ABC):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def __memory_map__(fp: BinaryIO) -> Union[mmap.mmap, BytesIO]:
+        """
+        Memory-map an opened file. The pages of the file are loaded on demand, thus the file is not read as a whole.
+
+        Parameters
+        ----------
+        fp: BinaryIO
+            File opened in binary read mode
+
+        Returns
+        -------
+        mapped: Union[mmap.mmap, BytesIO]
+            Read-only memory map of the file; an empty `BytesIO` for empty files, as those cannot be mapped.
+        """
+        if os.fstat(fp.fileno()).st_size == 0:
+            return BytesIO()
+        return mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
 
 class EndOfStream(Exception):
     """
@@ -95,15 +115,15 @@ class Stream:
 
     Parameters
     ----------
-    stream: bytes
-        Content byte arrays
+    stream: Union[bytes, memoryview, mmap.mmap]
+        Content byte arrays or any other object supporting the buffer protocol, e.g., a memory-mapped file
     """
-    def __init__(self, stream: bytes):
+    def __init__(self, stream: Union[bytes, memoryview, mmap.mmap]):
         self.__idx: int = 0
-        self.__stream: bytes = stream
-        self.__length: int = len(stream)
+        self.__stream: memoryview = stream if isinstance(stream, memoryview) else memoryview(stream)
+        self.__length: int = len(self.__stream)
 
-    def read(self, num: int) -> Union[bytes, int]:
+    def read(self, num: int) -> memoryview:
         """
         Read bytes from byte array.
         Parameters
@@ -113,14 +133,33 @@ class Stream:
 
         Returns
         -------
-            value: Union[bytes, int]
+            value: memoryview
+                View on the read bytes, no copy is created
         Raises
         ------
         EndOfStream
             Raised if the end of the stream has been reached
         """
-        if self.__idx >= self.__length:
+        value: Optional[memoryview] = self.read_or_none(num)
+        if value is None:
             raise EndOfStream()
+        return value
+
+    def read_or_none(self, num: int) -> Optional[memoryview]:
+        """
+        Read bytes from byte array, without raising an exception if the end of the stream has been reached.
+        Parameters
+        ----------
+        num: int
+            Number of bytes to be read
+
+        Returns
+        -------
+            value: Optional[memoryview]
+                View on the read bytes, `None` if the end of the stream has been reached
+        """
+        if self.__idx >= self.__length:
+            return None
         end = self.__idx + num
         if end > self.__length:
             end = self.__length
@@ -6,10 +6,15 @@ This package contains all decoders for the different versions of the Universal I
 
 - Version 3.0.0
 - Version 3.1.0
+
+The decoder modules are imported lazily on first access.
 """
+import importlib
+
 __all__ = ['base', 'decoder_3_0_0', 'decoder_3_1_0']
 
 
-from uim.codec.parser.decoder import base
-from uim.codec.parser.decoder import decoder_3_0_0
-from uim.codec.parser.decoder import decoder_3_1_0
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,8 +12,23 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import logging
+import operator
 from abc import ABC
-from typing import List, Tuple, Any, Union
+from functools import lru_cache
+from itertools import accumulate, islice, repeat
+from typing import List, Tuple, Any, Union, Dict
+
+import numpy as np
+from google.protobuf.internal import api_implementation
+
+# Create the Logger
+logger: logging.Logger = logging.getLogger(__name__)
+
+if api_implementation.Type() == 'python':
+    logger.debug('Pure-Python protobuf runtime is active, decoding UIM files is considerably slower than with the '
+                 'C++ runtime. Install a protobuf build with the C++ extension and set '
+                 'PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=cpp.')
 
 
 class CodecDecoder(ABC):
@@ -22,6 +37,8 @@ class CodecDecoder(ABC):
     ============
     Abstract codec decoder for the different versions of the Universal Ink Model (UIM) format.
     """
+    VECTORIZE_THRESHOLD: int = 128
+    """Minimum number of values for which the decoding is done with NumPy."""
 
     @classmethod
     def __parse_properties__(cls, properties: Any) -> List[Tuple[str, str]]:
@@ -38,10 +55,111 @@ class CodecDecoder(ABC):
         List[Tuple[str, str]]
             List of properties.
         """
-        prop: List[Tuple[str, str]] = []
-        for p in properties:
-            prop.append((p.name, p.value))
-        return prop
+        return [(p.name, p.value) for p in properties]
+
+    @staticmethod
+    def __lookup_table__(mapping: Dict[int, Any]) -> Tuple[Any, ...]:
+        """
+        Converts a mapping of the protobuf enum values, which are contiguous integers starting at 0, into a tuple
+        indexed by the enum value.
+
+        Parameters
+        ----------
+        mapping: Dict[int, Any]
+            Mapping from protobuf enum value to internal enum.
+
+        Returns
+        -------
+        Tuple[Any, ...]
+            Lookup table
+
+        Raises
+        ------
+        KeyError
+            If the enum values are not contiguous.
+        """
+        return tuple(mapping[value] for value in range(len(mapping)))
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def __factored_resolution__(precision: int, resolution: float) -> float:
+        """
+        Scaling factor of the encoded values, i.e., `resolution * 10 ** precision`.
+        Files only use a handful of different precisions and resolutions, thus the factor is cached.
+
+        Parameters
+        ----------
+        precision: int
+            Precision of the values.
+        resolution: float
+            Resolution of the values.
+
+        Returns
+        -------
+        float
+            Scaling factor.
+        """
+        return resolution * 10.0 ** precision
+
+    @staticmethod
+    def __decode_vectorized__(values: Union[List[float], np.ndarray], factored_resolution: float,
+                              start_value: float) -> List[float]:
+        """
+        Decode delta encoded float values with NumPy.
+
+        The start value is added to the first scaled value before the cumulative sum, thus the additions happen in
+        the same order as in the sequential decoding and the results are identical.
+
+        Parameters
+        ----------
+        values: Union[List[float], np.ndarray]
+            List of values to decode.
+        factored_resolution: float
+            Scaling factor of the values.
+        start_value: float
+            Start value, already scaled.
+
+        Returns
+        -------
+        List[float]
+            List of decoded values.
+        """
+        if not isinstance(values, (list, np.ndarray)):
+            # Repeated protobuf fields are sliced in bulk, NumPy would otherwise read them element by element
+            values = values[:]
+        scaled: np.ndarray = np.asarray(values, dtype=np.float64) / factored_resolution
+        if scaled.size == 0:
+            return []
+        scaled[0] += start_value
+        return np.cumsum(scaled).tolist()
+
+    @classmethod
+    def __decode_timestamps__(cls, values: List[int], precision: int, resolution: float = 1.,
+                              start_value: float = 0) -> List[float]:
+        """
+        Decode the delta encoded values of a timestamp channel.
+
+        Timestamps are the longest channels of a sensor data sequence, thus they are always decoded with NumPy.
+
+        Parameters
+        ----------
+        values: List[int]
+            List of values to decode.
+        precision: int
+            Precision of the values.
+        resolution: float [default: 1]
+            Resolution of the values.
+        start_value: float [default: 0]
+            Timestamp of the sensor data sequence.
+
+        Returns
+        -------
+        List[float]
+            List of decoded timestamps.
+        """
+        factored_resolution: float = CodecDecoder.__factored_resolution__(precision, resolution)
+        last: float = start_value if start_value == 0. else float(start_value / factored_resolution)
+        return CodecDecoder.__decode_vectorized__(values, factored_resolution, last)
 
     @classmethod
     def __decode__(cls, values: List[float], precision: int, resolution: float = 1., start_value: float = 0,
@@ -51,8 +169,8 @@ class CodecDecoder(ABC):
 
         Parameters
         ----------
-        values: List[float]
-            List of values to decode.
+        values: Union[List[float], np.ndarray]
+            List of values to decode. NumPy arrays and long lists are decoded with NumPy.
         precision: int
             Precision of the values.
         resolution: float [default: 1]
@@ -67,10 +185,15 @@ class CodecDecoder(ABC):
         List[float]
             List of decoded values.
         """
-        factor: float = 10.0 ** precision
+        factored_resolution: float = CodecDecoder.__factored_resolution__(precision, resolution)
+        last: float = start_value if start_value == 0. else float(start_value / factored_resolution)
+        if data_type is float and (isinstance(values, np.ndarray) or len(values) >= CodecDecoder.VECTORIZE_THRESHOLD):
+            return CodecDecoder.__decode_vectorized__(values, factored_resolution, last)
+        if data_type is float:
+            # Scaling and delta decoding both run in C, the initial value is skipped
+            scaled = map(operator.truediv, values, repeat(factored_resolution))
+            return list(islice(accumulate(scaled, operator.add, initial=last), 1, None))
         converted: List[float] = []
-        factored_resolution: float = resolution * factor
-        last: float = start_value if start_value == 0. else float(start_value / (resolution * factor))
         for v in values:
             v = v / factored_resolution
             converted.append(data_type(last + v))
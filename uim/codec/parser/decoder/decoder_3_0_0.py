@@ -12,10 +12,11 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import ctypes
+import sys
 import uuid
-from io import BytesIO
-from typing import List, BinaryIO, Dict, Optional
+from functools import lru_cache
+from io import BytesIO, SEEK_CUR
+from typing import List, BinaryIO, Dict, Optional, Tuple
 
 from google.protobuf import json_format
 
@@ -24,14 +25,16 @@ from uim.codec.base import DATA_HEADER
 from uim.codec.context.decoder import DecoderContext
 from uim.codec.parser.base import FormatException, SupportedFormats
 from uim.codec.parser.decoder.base import CodecDecoder
-from uim.model.base import UUIDIdentifier, Identifier
+from uim.model.base import Identifier
 from uim.model.ink import InkModel, InkTree, ViewTree
 from uim.model.inkdata.brush import RasterBrush, VectorBrush, BrushPolygon, BlendMode, BrushPolygonUri, RotationMode
 from uim.model.inkdata.strokes import Stroke, Style, PathPointProperties
 from uim.model.inkinput.inputdata import InkSensorType, InputContext, SensorContext, SensorChannel, \
-    InkSensorMetricType, InkInputType, InputDevice, InkInputProvider, Environment, SensorChannelsContext, DataType
-from uim.model.inkinput.sensordata import SensorData, ChannelData, InkState
+    InkSensorMetricType, InkInputType, InputDevice, InkInputProvider, Environment, SensorChannelsContext, DataType, \
+    InputContextRepository
+from uim.model.inkinput.sensordata import SensorData, InkState
 from uim.model.semantics.node import BoundingBox, StrokeNode, StrokeGroupNode
+from uim.model.semantics.structures import EMPTY_BOUNDING_BOX
 from uim.model.semantics.schema import CommonViews
 from uim.utils.matrix import Matrix4x4
 
@@ -56,6 +59,8 @@ class UIMDecoder300(CodecDecoder):
         uim_3_0_0.NORMALIZED: InkSensorMetricType.NORMALIZED
     }
     """Mapping metric types from UIM v3.0.0 to internal enum."""
+    LUT_INK_METRICS_TYPE: Tuple[InkSensorMetricType, ...] = CodecDecoder.__lookup_table__(MAP_INK_METRICS_TYPE)
+    """Metric types indexed by the UIM v3.0.0 enum value."""
 
     MAP_STATE_TYPE: Dict[int, InkState] = {
         uim_3_0_0.PLANE: InkState.PLANE,
@@ -64,6 +69,8 @@ class UIMDecoder300(CodecDecoder):
         uim_3_0_0.VOLUME_HOVERING: InkState.VOLUME_HOVERING
     }
     """Mapping of the uim input data states."""
+    LUT_STATE_TYPE: Tuple[InkState, ...] = CodecDecoder.__lookup_table__(MAP_STATE_TYPE)
+    """Input data states indexed by the UIM v3.0.0 enum value."""
 
     MAP_CHANNEL_TYPE: Dict[int, InkSensorType] = {
         InkSensorType.X.value: InkSensorType.X,
@@ -86,6 +93,8 @@ class UIMDecoder300(CodecDecoder):
         InkInputType.MOUSE.value: InkInputType.MOUSE
     }
     """Mapping for input provider."""
+    LUT_INPUT_PROVIDER_TYPE: Tuple[InkInputType, ...] = CodecDecoder.__lookup_table__(MAP_INPUT_PROVIDER_TYPE)
+    """Input providers indexed by the UIM v3.0.0 enum value."""
 
     MAP_BLEND_MODE: Dict[int, BlendMode] = {
         uim_3_0_0.SOURCE_OVER: BlendMode.SOURCE_OVER,
@@ -97,6 +106,8 @@ class UIMDecoder300(CodecDecoder):
         uim_3_0_0.MAX: BlendMode.MAX
     }
     """Mapping for blending mode."""
+    LUT_BLEND_MODE: Tuple[BlendMode, ...] = CodecDecoder.__lookup_table__(MAP_BLEND_MODE)
+    """Blending modes indexed by the UIM v3.0.0 enum value."""
 
     # Map for rotation mode
     MAP_ROTATION_MODE: Dict[int, RotationMode] = {
@@ -104,6 +115,27 @@ class UIMDecoder300(CodecDecoder):
         uim_3_0_0.RANDOM: RotationMode.RANDOM,
         uim_3_0_0.TRAJECTORY: RotationMode.TRAJECTORY
     }
+    LUT_ROTATION_MODE: Tuple[RotationMode, ...] = CodecDecoder.__lookup_table__(MAP_ROTATION_MODE)
+    """Rotation modes indexed by the UIM v3.0.0 enum value."""
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __uimid__(uuid_str: str) -> uuid.UUID:
+        """
+        Convert from string to UimID (UUID). The same identifiers are referenced many times within a document,
+        thus the conversion is cached for the duration of `decode_document`.
+
+        Parameters
+        ----------
+        uuid_str: `str`
+            UimID as s-form
+
+        Returns
+        -------
+        uuid: `UUID`
+            UUID from string
+        """
+        return Identifier.str_to_uimid(uuid_str)
 
     @classmethod
     def decode(cls, riff: BytesIO, size_head: int) -> InkModel:
@@ -127,10 +159,14 @@ class UIMDecoder300(CodecDecoder):
         FormatException
             Raised if the data header is missing.
         """
-        riff.read((size_head - 3) + 1)
+        # Skip the remaining header, seeking avoids reading the skipped bytes into memory
+        if hasattr(riff, 'seek'):
+            riff.seek(size_head - 2, SEEK_CUR)
+        else:
+            riff.read(size_head - 2)
         if riff.read(4) != DATA_HEADER:
             raise FormatException('Data header missing.')
-        data_size = ctypes.c_uint32(int.from_bytes(riff.read(4), byteorder='little')).value
+        data_size = int.from_bytes(riff.read(4), byteorder='little')
         message: bytes = riff.read(data_size)
         # read document
         document: uim_3_0_0.InkObject = uim_3_0_0.InkObject()
@@ -141,6 +177,8 @@ class UIMDecoder300(CodecDecoder):
     def decode_json(cls, fp: BinaryIO) -> InkModel:
         """
         Decoding Universal Ink Model (JSON Protobuf encoded) content file.
+        Unknown fields are ignored. Binary encoded content is considerably faster to decode, thus it should be
+        passed to `UIMParser.parse` rather than being converted to JSON.
 
         Parameters
         ----------
@@ -154,7 +192,7 @@ class UIMDecoder300(CodecDecoder):
         """
         message = fp.read()
         document: uim_3_0_0.InkObject = uim_3_0_0.InkObject()
-        document: uim_3_0_0.InkObject = json_format.Parse(message, document)
+        document: uim_3_0_0.InkObject = json_format.Parse(message, document, ignore_unknown_fields=True)
         return UIMDecoder300.decode_document(document)
 
     @classmethod
@@ -174,24 +212,28 @@ class UIMDecoder300(CodecDecoder):
         """
         context: DecoderContext = DecoderContext(version=SupportedFormats.UIM_VERSION_3_0_0.value,
                                                  ink_model=InkModel(SupportedFormats.UIM_VERSION_3_0_0.value))
-        # Set properties
-        context.ink_model.properties = CodecDecoder.__parse_properties__(document.properties)
-        # Parse input data
-        UIMDecoder300.__parse_input_data__(context, document.inputData)
-        # Parse ink data
-        UIMDecoder300.__parse_ink_data__(context, document.inkData)
-        # Parse brushes
-        UIMDecoder300.__parse_brushes__(context, document.brushes)
-        # Parse main tree
-        UIMDecoder300.__parse_ink_tree__(context, document.inkTree, CommonViews.MAIN_INK_TREE.value)
-        # Parse view
-        for view in document.views:
-            UIMDecoder300.__parse_ink_tree__(context, view.tree, view.name)
-        # Parse knowledge graph
-        UIMDecoder300.__parse_knowledge_graph__(context, document.knowledgeGraph)
-        UIMDecoder300.__parse_transform__(document, context.ink_model)
-        # Finally upgrade the URIs
-        context.upgrade_uris()
+        try:
+            # Set properties
+            context.ink_model.properties = CodecDecoder.__parse_properties__(document.properties)
+            # Parse input data
+            UIMDecoder300.__parse_input_data__(context, document.inputData)
+            # Parse ink data
+            UIMDecoder300.__parse_ink_data__(context, document.inkData)
+            # Parse brushes
+            UIMDecoder300.__parse_brushes__(context, document.brushes)
+            # Parse main tree
+            UIMDecoder300.__parse_ink_tree__(context, document.inkTree, CommonViews.MAIN_INK_TREE.value)
+            # Parse view
+            for view in document.views:
+                UIMDecoder300.__parse_ink_tree__(context, view.tree, view.name)
+            # Parse knowledge graph
+            UIMDecoder300.__parse_knowledge_graph__(context, document.knowledgeGraph)
+            UIMDecoder300.__parse_transform__(document, context.ink_model)
+            # Finally upgrade the URIs
+            context.upgrade_uris()
+        finally:
+            # Identifiers are only shared within a document
+            UIMDecoder300.__uimid__.cache_clear()
         return context.ink_model
 
     @classmethod
@@ -207,38 +249,44 @@ class UIMDecoder300(CodecDecoder):
             Input data structure
         """
         input_context_data: uim_3_0_0.InputContextData = input_data.inputContextData
+        input_configuration: InputContextRepository = context.ink_model.input_configuration
         # Parse Input Contexts
-        for inputContext in input_context_data.inputContexts:
-            input_context: InputContext = InputContext(
-                UUIDIdentifier.str_to_uimid(inputContext.id),
-                UUIDIdentifier.str_to_uimid(inputContext.environmentID),
-                UUIDIdentifier.str_to_uimid(inputContext.sensorContextID))
-            context.ink_model.input_configuration.input_contexts.append(input_context)
+        input_configuration.input_contexts.extend([
+            InputContext(
+                UIMDecoder300.__uimid__(inputContext.id),
+                UIMDecoder300.__uimid__(inputContext.environmentID),
+                UIMDecoder300.__uimid__(inputContext.sensorContextID)
+            )
+            for inputContext in input_context_data.inputContexts
+        ])
 
         # Parse Ink Input Providers
-        for inkInputProvider in input_context_data.inkInputProviders:
-            properties = CodecDecoder.__parse_properties__(inkInputProvider.properties)
-            ink_input_provider = InkInputProvider(
-                UUIDIdentifier.str_to_uimid(inkInputProvider.id),
-                UIMDecoder300.MAP_INPUT_PROVIDER_TYPE[inkInputProvider.type],
-                properties
+        input_configuration.ink_input_providers.extend([
+            InkInputProvider(
+                UIMDecoder300.__uimid__(inkInputProvider.id),
+                UIMDecoder300.LUT_INPUT_PROVIDER_TYPE[inkInputProvider.type],
+                CodecDecoder.__parse_properties__(inkInputProvider.properties)
             )
-            context.ink_model.input_configuration.ink_input_providers.append(ink_input_provider)
+            for inkInputProvider in input_context_data.inkInputProviders
+        ])
 
         # Parse Input Devices
-        for inputDevice in input_context_data.inputDevices:
-            properties = CodecDecoder.__parse_properties__(inputDevice.properties)
-            input_device: InputDevice = InputDevice(
-                UUIDIdentifier.str_to_uimid(inputDevice.id),
-                properties
+        input_configuration.devices.extend([
+            InputDevice(
+                UIMDecoder300.__uimid__(inputDevice.id),
+                CodecDecoder.__parse_properties__(inputDevice.properties)
             )
-            context.ink_model.input_configuration.devices.append(input_device)
+            for inputDevice in input_context_data.inputDevices
+        ])
 
         # Parse Environments
-        for environment in input_context_data.environments:
-            properties = CodecDecoder.__parse_properties__(environment.properties)
-            environment = Environment(UUIDIdentifier.str_to_uimid(environment.id), properties)
-            context.ink_model.input_configuration.environments.append(environment)
+        input_configuration.environments.extend([
+            Environment(
+                UIMDecoder300.__uimid__(environment.id),
+                CodecDecoder.__parse_properties__(environment.properties)
+            )
+            for environment in input_context_data.environments
+        ])
 
         # Parse Sensor Data Contexts
         for sensorContext in input_context_data.sensorContexts:
@@ -247,84 +295,114 @@ class UIMDecoder300(CodecDecoder):
             # Parse Sensor Channels Contexts
             for sensorChannelsContext in sensorContext.sensorChannelsContext:
                 channels: list = []
+                # Identifiers shared by all channels of the context
                 input_provider_uuid: Optional[uuid.UUID] = None
                 if sensorChannelsContext.inkInputProviderID:
-                    input_provider_uuid = Identifier.str_to_uimid(sensorChannelsContext.inkInputProviderID)
+                    input_provider_uuid = UIMDecoder300.__uimid__(sensorChannelsContext.inkInputProviderID)
+                input_device_uuid: uuid.UUID = UIMDecoder300.__uimid__(sensorChannelsContext.inputDeviceID)
                 # Parse Sensor Channels
                 for sensorChannel in sensorChannelsContext.channels:
                     sensor_channel: SensorChannel = SensorChannel(
-                        UUIDIdentifier.str_to_uimid(sensorChannel.id),
+                        UIMDecoder300.__uimid__(sensorChannel.id),
                         UIMDecoder300.MAP_CHANNEL_TYPE[sensorChannel.type],
-                        UIMDecoder300.MAP_INK_METRICS_TYPE[sensorChannel.metric],
+                        UIMDecoder300.LUT_INK_METRICS_TYPE[sensorChannel.metric],
                         sensorChannel.resolution,
                         sensorChannel.min,
                         sensorChannel.max,
                         sensorChannel.precision,
                         data_type=DataType.FLOAT32,
                         ink_input_provider_id=input_provider_uuid,
-                        input_device_id=Identifier.str_to_uimid(sensorChannelsContext.inputDeviceID)
+                        input_device_id=input_device_uuid
                     )
                     channels.append(sensor_channel)
-                input_provider_uuid: Optional[uuid.UUID] = None
-                if sensorChannelsContext.inkInputProviderID:
-                    input_provider_uuid = Identifier.str_to_uimid(sensorChannelsContext.inkInputProviderID)
                 sensor_channel_context: SensorChannelsContext = SensorChannelsContext(
-                    Identifier.str_to_uimid(sensorChannelsContext.id),
+                    UIMDecoder300.__uimid__(sensorChannelsContext.id),
                     channels,
                     sensorChannelsContext.samplingRateHint.value,
                     sensorChannelsContext.latency.value,
                     input_provider_uuid,
-                    Identifier.str_to_uimid(sensorChannelsContext.inputDeviceID),
+                    input_device_uuid,
                 )
                 sensor_channels_contexts.append(sensor_channel_context)
             sensor_context: SensorContext = SensorContext(
-                Identifier.str_to_uimid(sensorContext.id),
+                UIMDecoder300.__uimid__(sensorContext.id),
                 sensor_channels_contexts
             )
-            context.ink_model.input_configuration.sensor_contexts.append(sensor_context)
+            input_configuration.sensor_contexts.append(sensor_context)
 
         # Parse Sensor Data
-        sensor_data_array: list = []
-        for sensorData in input_data.sensorData:
-            input_context: InputContext = context.ink_model. \
-                input_configuration.get_input_context(Identifier.str_to_uimid(sensorData.inputContextID))
-            sensor_ctx: SensorContext = context.ink_model.input_configuration. \
-                get_sensor_context(input_context.sensor_context_id)
+        context.ink_model.sensor_data.sensor_data = UIMDecoder300.__parse_sensor_data__(input_configuration,
+                                                                                       input_data.sensorData)
+
+    @classmethod
+    def __parse_sensor_data__(cls, input_configuration: InputContextRepository,
+                              proto_sensor_data: List[uim_3_0_0.SensorData]) -> List[SensorData]:
+        """
+        Parse sensor data.
+
+        This is the innermost loop of the decoder, it runs for every channel of every sensor data sequence. Thus,
+        the functions used per channel are bound to locals once.
+
+        Parameters
+        ----------
+        input_configuration: InputContextRepository
+            Input configuration with the already parsed input and sensor contexts
+        proto_sensor_data: List[uim_3_0_0.SensorData]
+            Sensor data structures
+
+        Returns
+        -------
+        List[SensorData]
+            Parsed sensor data
+        """
+        # Documents with rendered ink only do not carry sensor data
+        if len(proto_sensor_data) == 0:
+            return []
+        uimid = UIMDecoder300.__uimid__
+        decode = CodecDecoder.__decode__
+        decode_timestamps = CodecDecoder.__decode_timestamps__
+        states: Tuple[InkState, ...] = UIMDecoder300.LUT_STATE_TYPE
+        # The number of sensor data sequences is known up front
+        sensor_data_array: List[Optional[SensorData]] = [None] * len(proto_sensor_data)
+        # Channel lookup per sensor context, shared by all sensor data referencing the context
+        channels_by_context: Dict[uuid.UUID, Dict[uuid.UUID, SensorChannel]] = {}
+        for sensor_data_idx, sensorData in enumerate(proto_sensor_data):
+            input_context_id: uuid.UUID = uimid(sensorData.inputContextID)
+            input_context: InputContext = input_configuration.get_input_context(input_context_id)
+            sensor_ctx: SensorContext = input_configuration.get_sensor_context(input_context.sensor_context_id)
+            channel_by_id: Optional[Dict[uuid.UUID, SensorChannel]] = \
+                channels_by_context.get(input_context.sensor_context_id)
+            if channel_by_id is None:
+                channel_by_id = {c.id: c for cs in sensor_ctx.sensor_channels_contexts for c in cs.channels}
+                channels_by_context[input_context.sensor_context_id] = channel_by_id
             # Add sensor data
             sensor_data: SensorData = SensorData(
-                Identifier.str_to_uimid(sensorData.id),
-                Identifier.str_to_uimid(sensorData.inputContextID),
-                UIMDecoder300.MAP_STATE_TYPE[sensorData.state],
+                uimid(sensorData.id),
+                input_context_id,
+                states[sensorData.state],
                 sensorData.timestamp
             )
             for dataChannel in sensorData.dataChannels:
-                sensor_type: SensorChannel = sensor_ctx.get_channel_by_id(
-                    Identifier.str_to_uimid(dataChannel.sensorChannelID)
-                )
-                if sensor_type.type == InkSensorType.TIMESTAMP:
-                    ctx: SensorChannel = sensor_ctx.get_channel_by_id(
-                        Identifier.str_to_uimid(dataChannel.sensorChannelID))
-                    channel_data: ChannelData = ChannelData(
-                        Identifier.str_to_uimid(dataChannel.sensorChannelID),
-                        CodecDecoder.__decode__(dataChannel.values, ctx.precision, ctx.resolution,
-                                                start_value=sensorData.timestamp, data_type=float),
-                    )
+                channel_id: uuid.UUID = uimid(dataChannel.sensorChannelID)
+                ctx: Optional[SensorChannel] = channel_by_id.get(channel_id)
+                if ctx is None:
+                    # Raises an exception for unknown channels
+                    ctx = sensor_ctx.get_channel_by_id(channel_id)
+                if ctx.type == InkSensorType.TIMESTAMP:
+                    values: list = decode_timestamps(dataChannel.values, ctx.precision, ctx.resolution,
+                                                     start_value=sensorData.timestamp)
                 else:
-                    ctx: SensorChannel = sensor_ctx.get_channel_by_id(
-                        Identifier.str_to_uimid(dataChannel.sensorChannelID)
-                    )
-                    channel_data: ChannelData = ChannelData(
-                        Identifier.str_to_uimid(dataChannel.sensorChannelID),
-                        CodecDecoder.__decode__(dataChannel.values, ctx.precision, ctx.resolution),
-                    )
-                sensor_data.add_data(sensor_type, channel_data.values)
-            sensor_data_array.append(sensor_data)
-        context.ink_model.sensor_data.sensor_data = sensor_data_array
+                    values: list = decode(dataChannel.values, ctx.precision, ctx.resolution)
+                sensor_data.add_data(ctx, values)
+            sensor_data_array[sensor_data_idx] = sensor_data
+        return sensor_data_array
 
     @classmethod
     def __parse_ink_data__(cls, context: DecoderContext, ink_data: uim_3_0_0.InkData):
         """
         Parse ink data.
+        A `Stroke`, `Style` and `PathPointProperties` instance is created per stroke, these classes use `__slots__`
+        to keep the memory footprint of large documents low.
 
         Parameters
         ----------
@@ -338,8 +416,11 @@ class UIMDecoder300(CodecDecoder):
         model - `InkModel`
             Parsed `InkModel` from UIM v3.0.0 ink content
         """
+        # The strokes are added to the context once all of them are decoded, thus a stroke that fails to decode
+        # leaves no placeholders behind
+        strokes: List[Optional[Stroke]] = [None] * len(ink_data.strokes)
         # Iterate over strokes
-        for p in ink_data.strokes:
+        for stroke_idx, p in enumerate(ink_data.strokes):
             properties = p.style.properties
             path_point_properties: PathPointProperties = PathPointProperties(
                 properties.size.value,
@@ -355,17 +436,18 @@ class UIMDecoder300(CodecDecoder):
                 properties.offsetY.value,
                 properties.offsetZ.value,
             )
+            # Only a handful of URIs are shared by all strokes, interning keeps a single copy of each
             style: Style = Style(
                 path_point_properties,
-                p.style.brushURI,
+                sys.intern(p.style.brushURI),
                 p.style.particlesRandomSeed,
-                p.style.renderModeURI
+                sys.intern(p.style.renderModeURI)
             )
             sensor_id: Optional[uuid.UUID] = None
             if p.sensorDataID:
-                sensor_id = Identifier.str_to_uimid(p.sensorDataID)
+                sensor_id = UIMDecoder300.__uimid__(p.sensorDataID)
             stroke: Stroke = Stroke(
-                Identifier.str_to_uimid(p.id),
+                UIMDecoder300.__uimid__(p.id),
                 p.sensorDataOffset,
                 sensor_id,
                 p.sensorDataMapping,
@@ -373,22 +455,26 @@ class UIMDecoder300(CodecDecoder):
             )
             stroke.start_parameter = p.startParameter
             stroke.end_parameter = p.endParameter
-            stroke.red = list(p.red)
-            stroke.green = list(p.green)
-            stroke.blue = list(p.blue)
-            stroke.alpha = list(p.alpha)
-            stroke.splines_x = list(p.splineX)
-            stroke.splines_y = list(p.splineY)
-            stroke.splines_z = list(p.splineZ)
-            stroke.sizes = list(p.size)
-            stroke.rotations = list(p.rotation)
-            stroke.scales_x = list(p.scaleX)
-            stroke.scales_y = list(p.scaleY)
-            stroke.scales_z = list(p.scaleZ)
-            stroke.offsets_x = list(p.offsetX)
-            stroke.offsets_y = list(p.offsetY)
-            stroke.offsets_z = list(p.offsetZ)
-            context.strokes.append(stroke)
+            # Slicing copies the repeated fields in bulk, list() would iterate them element by element
+            stroke.red = p.red[:]
+            stroke.green = p.green[:]
+            stroke.blue = p.blue[:]
+            stroke.alpha = p.alpha[:]
+            stroke.__set_splines__((
+                p.splineX[:],
+                p.splineY[:],
+                p.splineZ[:],
+                p.size[:],
+                p.rotation[:],
+                p.scaleX[:],
+                p.scaleY[:],
+                p.scaleZ[:],
+                p.offsetX[:],
+                p.offsetY[:],
+                p.offsetZ[:]
+            ))
+            strokes[stroke_idx] = stroke
+        context.strokes.extend(strokes)
 
     @classmethod
     def __parse_brushes__(cls, context: DecoderContext, brushes: uim_3_0_0.Brushes):
@@ -414,9 +500,8 @@ class UIMDecoder300(CodecDecoder):
                 if p.shapeURI:
                     brush_prototype: BrushPolygonUri = BrushPolygonUri(p.shapeURI, p.size)
                 else:
-                    points: list = []
-                    for idx, _ in enumerate(p.coordX):
-                        points.append((p.coordX[idx], p.coordY[idx]))
+                    # Pair the coordinates of bulk copies instead of indexing the repeated fields per point
+                    points: list = list(zip(p.coordX[:], p.coordY[:]))
                     brush_prototype: BrushPolygon = BrushPolygon(min_scale=p.size, points=points, indices=p.indices)
                 prototypes.append(brush_prototype)
             brush: VectorBrush = VectorBrush(
@@ -431,36 +516,36 @@ class UIMDecoder300(CodecDecoder):
                 rasterBrush.name,
                 rasterBrush.spacing,
                 rasterBrush.scattering,
-                UIMDecoder300.MAP_ROTATION_MODE[rasterBrush.rotationMode],
+                UIMDecoder300.LUT_ROTATION_MODE[rasterBrush.rotationMode],
                 rasterBrush.shapeTexture,
-                rasterBrush.shapeTextureURI,
+                sys.intern(rasterBrush.shapeTextureURI),
                 rasterBrush.fillTexture,
-                rasterBrush.fillTextureURI,
+                sys.intern(rasterBrush.fillTextureURI),
                 rasterBrush.fillWidth,
                 rasterBrush.fillHeight,
                 rasterBrush.randomizeFill,
-                UIMDecoder300.MAP_BLEND_MODE[rasterBrush.blendMode]
+                UIMDecoder300.LUT_BLEND_MODE[rasterBrush.blendMode]
             )
             context.ink_model.brushes.add_raster_brush(brush)
 
     @classmethod
-    def __extract_bounding_box__(cls, rect: uim_3_0_0.Rectangle) -> BoundingBox:
+    def __extract_bounding_box__(cls, rect: Optional[uim_3_0_0.Rectangle]) -> BoundingBox:
         """
         Extracts the bounding box.
 
         Parameters
         ----------
-        rect: uim_3_0_0.Rectangle
-            Rectangle structure
+        rect: Optional[uim_3_0_0.Rectangle]
+            Rectangle structure, None if the node has no bounding box
 
         Returns
         -------
         bounding_box - `BoundingBox`
-            Bounding box structure
+            Bounding box structure, the shared `EMPTY_BOUNDING_BOX` if no rectangle is given
         """
-        if rect:
+        if rect is not None:
             return BoundingBox(rect.x, rect.y, rect.width, rect.height)
-        return BoundingBox(0., 0., 0., 0.)
+        return EMPTY_BOUNDING_BOX
 
     @classmethod
     def __parse_ink_tree__(cls, context: DecoderContext, proto_tree: List[uim_3_0_0.Node], view: str):
@@ -476,7 +561,6 @@ class UIMDecoder300(CodecDecoder):
         view: str
             Name of the view.
         """
-        stack: List[StrokeGroupNode] = []
         # Sanity checks
         if proto_tree is None or len(proto_tree) == 0:
             raise FormatException("Tree is empty")
@@ -491,32 +575,28 @@ class UIMDecoder300(CodecDecoder):
             context.ink_model.add_tree(tree)
         # Root element
         root_id: str = proto_tree[0].id
-        prev_node: StrokeGroupNode = StrokeGroupNode(Identifier.str_to_uimid(root_id))
-        tree.root = prev_node
-        tree.root.group_bounding_box = UIMDecoder300.__extract_bounding_box__(proto_tree[0].groupBoundingBox)
-        # Parent
-        parent: StrokeGroupNode = tree.root
+        tree.root = StrokeGroupNode(UIMDecoder300.__uimid__(root_id))
+        tree.root.group_bounding_box = UIMDecoder300.__extract_bounding_box__(
+            proto_tree[0].groupBoundingBox if proto_tree[0].HasField('groupBoundingBox') else None)
+        # Latest group node per depth, the parent of a node is the last group above its depth
+        groups_by_depth: List[StrokeGroupNode] = [tree.root]
         # Iterate over all children of root
         for node_idx in range(1, len(proto_tree)):
             node: uim_3_0_0.Node = proto_tree[node_idx]
-            if node.depth > len(stack):
-                stack.append(parent)
-                parent = prev_node
-            elif node.depth < len(stack):
-                while node.depth < len(stack):
-                    parent = stack.pop()
-
-            bbox: BoundingBox = UIMDecoder300.__extract_bounding_box__(node.groupBoundingBox)
+            del groups_by_depth[max(node.depth, 1):]
+            parent: StrokeGroupNode = groups_by_depth[-1]
+            # Sub-messages are never falsy, thus the presence of the bounding box is checked explicitly
+            bbox: BoundingBox = UIMDecoder300.__extract_bounding_box__(
+                node.groupBoundingBox if node.HasField('groupBoundingBox') else None)
             # Handle different node types
             if node.type == uim_3_0_0.STROKE_GROUP:  # Stroke Group Node
-                group_id: uuid.UUID = Identifier.str_to_uimid(node.id)
+                group_id: uuid.UUID = UIMDecoder300.__uimid__(node.id)
                 new_node: StrokeGroupNode = StrokeGroupNode(group_id)
                 new_node.group_bounding_box = bbox
-                # remember current node
-                prev_node = new_node
+                groups_by_depth.append(new_node)
             else:  # Stroke Node
                 index: int = node.index
-                if index > len(context.strokes):
+                if index >= len(context.strokes):
                     raise FormatException(f"Reference stroke with index:= {index} does not exist in UIM.")
                 stroke: Stroke = context.strokes[index]
                 # Create Stroke node
@@ -535,9 +615,8 @@ class UIMDecoder300(CodecDecoder):
         knowledge_graph: uim_3_0_0.TripleStore
             Knowledge graph structure
         """
-        for el in knowledge_graph.statements:
-            if el.subject != '':
-                context.ink_model.add_semantic_triple(el.subject, el.predicate, el.object)
+        context.ink_model.add_semantic_triples((el.subject, el.predicate, el.object)
+                                               for el in knowledge_graph.statements if el.subject != '')
 
     @classmethod
     def __parse_transform__(cls, document: uim_3_0_0.InkObject, ink_object: InkModel):
@@ -12,12 +12,14 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import ctypes
 import logging
+import mmap
+import struct
 import uuid
-from io import BytesIO
+from functools import lru_cache, partial
+from io import BytesIO, SEEK_CUR
 from logging import Logger
-from typing import Any, List, Tuple, Optional, Dict
+from typing import Any, List, Tuple, Optional, Dict, Union, Iterable
 
 import uim.codec.format.UIM_3_1_0_pb2 as uim_3_1_0
 from uim.codec.base import ContentType, PROPERTIES_HEADER, INPUT_DATA_HEADER, BRUSHES_HEADER, INK_DATA_HEADER, \
@@ -32,13 +34,17 @@ from uim.model.inkdata.brush import RasterBrush, VectorBrush, BrushPolygon, Blen
 from uim.model.inkdata.strokes import Stroke, PathPointProperties, Style
 from uim.model.inkinput.inputdata import InkSensorType, InputContext, SensorContext, SensorChannel, \
     InkSensorMetricType, InkInputType, InputDevice, InkInputProvider, Environment, SensorChannelsContext, DataType
-from uim.model.inkinput.sensordata import SensorData, ChannelData, InkState
+from uim.model.inkinput.sensordata import SensorData, InkState
 from uim.model.semantics.node import BoundingBox, StrokeGroupNode, StrokeNode, StrokeFragment
+from uim.model.semantics.structures import EMPTY_BOUNDING_BOX
 from uim.model.semantics.schema import CommonViews
 from uim.utils.matrix import Matrix4x4
 
 # Logger
 logger: Logger = logging.getLogger(__name__)
+# Pre-compiled layouts of the chunk description (version, content type, compression) and the chunk size
+CHUNK_DESCRIPTION_STRUCT: struct.Struct = struct.Struct('>BBBcc')
+CHUNK_SIZE_STRUCT: struct.Struct = struct.Struct('<I')
 
 
 class UIMDecoder310(CodecDecoder):
@@ -60,14 +66,24 @@ class UIMDecoder310(CodecDecoder):
     """Mapping of the `CompressionType`."""
 
     MAP_CHUNK_TYPE: Dict[bytes, Any] = {
-        PROPERTIES_HEADER: uim_3_1_0.Properties(),
-        INPUT_DATA_HEADER: uim_3_1_0.InputData(),
-        BRUSHES_HEADER: uim_3_1_0.Brushes(),
-        INK_DATA_HEADER: uim_3_1_0.InkData(),
-        KNOWLEDGE_HEADER: uim_3_1_0.TripleStore(),
-        INK_STRUCTURE_HEADER: uim_3_1_0.InkStructure()
+        PROPERTIES_HEADER: uim_3_1_0.Properties,
+        INPUT_DATA_HEADER: uim_3_1_0.InputData,
+        BRUSHES_HEADER: uim_3_1_0.Brushes,
+        INK_DATA_HEADER: uim_3_1_0.InkData,
+        KNOWLEDGE_HEADER: uim_3_1_0.TripleStore,
+        INK_STRUCTURE_HEADER: uim_3_1_0.InkStructure
     }
-    """Mapping of the different chunk types."""
+    """Mapping of the different chunk types to their protobuf message classes."""
+
+    MAP_CHUNK_PARSER: Dict[bytes, str] = {
+        PROPERTIES_HEADER: 'parse_properties',
+        INPUT_DATA_HEADER: 'parse_input_data',
+        BRUSHES_HEADER: 'parse_brushes',
+        INK_DATA_HEADER: 'parse_ink_data',
+        KNOWLEDGE_HEADER: 'parse_knowledge',
+        INK_STRUCTURE_HEADER: 'parse_ink_structure'
+    }
+    """Mapping of the different chunk types to the name of their parse method."""
 
     MAP_INK_METRICS_TYPE: Dict[int, InkSensorMetricType] = {
         uim_3_1_0.LENGTH: InkSensorMetricType.LENGTH,
@@ -129,6 +145,25 @@ class UIMDecoder310(CodecDecoder):
     def __init__(self):
         pass
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __uimid__(uuid_bytes: bytes) -> uuid.UUID:
+        """
+        Convert bytes array to UimID (UUID). The same identifiers are referenced many times within a document,
+        thus the conversion is cached for the duration of `decode`.
+
+        Parameters
+        ----------
+        uuid_bytes: `bytes`
+            Byte array encoding the UUID
+
+        Returns
+        -------
+        uuid: `UUID`
+            Valid UUID
+        """
+        return Identifier.from_bytes(uuid_bytes)
+
     @classmethod
     def parse_brushes(cls, context: DecoderContext, brushes: uim_3_1_0.Brushes):
         """
@@ -141,24 +176,28 @@ class UIMDecoder310(CodecDecoder):
         brushes: `uim_3_1_0.Brushes`
             Protobuf structure for brushes
         """
+        add_vector_brush = context.ink_model.brushes.add_vector_brush
+        add_raster_brush = context.ink_model.brushes.add_raster_brush
         # Decode vector brushes
         for vectorBrush in brushes.vectorBrushes:
             prototypes: list = []
             for p in vectorBrush.prototype:
-                if p.shapeURI:
-                    brush_prototype: BrushPolygonUri = BrushPolygonUri(p.shapeURI, p.size)
+                # Each field access on a message resolves its descriptor, thus fields are read once
+                shape_uri: str = p.shapeURI
+                size: float = p.size
+                if shape_uri:
+                    brush_prototype: BrushPolygonUri = BrushPolygonUri(shape_uri, size)
                 else:
-                    points: list = []
-                    for idx, _ in enumerate(p.coordX):
-                        points.append((p.coordX[idx], p.coordY[idx]))
-                    brush_prototype: BrushPolygon = BrushPolygon(p.size, points, p.indices)
+                    # Pair the coordinates of bulk copies instead of indexing the repeated fields per point
+                    points: list = list(zip(p.coordX[:], p.coordY[:]))
+                    brush_prototype: BrushPolygon = BrushPolygon(size, points, p.indices[:])
                 prototypes.append(brush_prototype)
             brush: VectorBrush = VectorBrush(
                 vectorBrush.name,
                 prototypes,
                 vectorBrush.spacing,
             )
-            context.ink_model.brushes.add_vector_brush(brush)
+            add_vector_brush(brush)
 
         # Decode raster brushes
         for rasterBrush in brushes.rasterBrushes:
@@ -167,8 +206,8 @@ class UIMDecoder310(CodecDecoder):
                 rasterBrush.spacing,
                 rasterBrush.scattering,
                 UIMDecoder310.MAP_ROTATION_MODE[rasterBrush.rotationMode],
-                rasterBrush.shapeTexture,
-                rasterBrush.shapeTextureURI,
+                rasterBrush.shapeTexture[:],
+                rasterBrush.shapeTextureURI[:],
                 rasterBrush.fillTexture,
                 rasterBrush.fillTextureURI,
                 rasterBrush.fillWidth,
@@ -176,7 +215,7 @@ class UIMDecoder310(CodecDecoder):
                 rasterBrush.randomizeFill,
                 UIMDecoder310.MAP_BLEND_MODE[rasterBrush.blendMode]
             )
-            context.ink_model.brushes.add_raster_brush(brush)
+            add_raster_brush(brush)
 
     @classmethod
     def parse_properties(cls, context: DecoderContext, properties: uim_3_1_0.Properties):
@@ -210,16 +249,16 @@ class UIMDecoder310(CodecDecoder):
         # Parse Input Contexts
         for inputContext in input_context_data.inputContexts:
             input_context: InputContext = InputContext(
-                Identifier.from_bytes(inputContext.id),
-                Identifier.from_bytes(inputContext.environmentID),
-                Identifier.from_bytes(inputContext.sensorContextID))
+                UIMDecoder310.__uimid__(inputContext.id),
+                UIMDecoder310.__uimid__(inputContext.environmentID),
+                UIMDecoder310.__uimid__(inputContext.sensorContextID))
             context.ink_model.input_configuration.input_contexts.append(input_context)
 
         # Parse Ink Input Providers
         for inkInputProvider in input_context_data.inkInputProviders:
             properties: list = CodecDecoder.__parse_properties__(inkInputProvider.properties)
             ink_input_provider: InkInputProvider = InkInputProvider(
-                Identifier.from_bytes(inkInputProvider.id),
+                UIMDecoder310.__uimid__(inkInputProvider.id),
                 UIMDecoder310.MAP_INPUT_PROVIDER_TYPE[inkInputProvider.type],
                 properties
             )
@@ -229,7 +268,7 @@ class UIMDecoder310(CodecDecoder):
         for inputDevice in input_context_data.inputDevices:
             properties: list = CodecDecoder.__parse_properties__(inputDevice.properties)
             input_device: InputDevice = InputDevice(
-                Identifier.from_bytes(inputDevice.id),
+                UIMDecoder310.__uimid__(inputDevice.id),
                 properties
             )
             context.ink_model.input_configuration.devices.append(input_device)
@@ -238,7 +277,7 @@ class UIMDecoder310(CodecDecoder):
         for e in input_context_data.environments:
             properties: list = CodecDecoder.__parse_properties__(e.properties)
             environment: Environment = Environment(
-                Identifier.from_bytes(e.id),
+                UIMDecoder310.__uimid__(e.id),
                 properties
             )
             context.ink_model.input_configuration.environments.append(environment)
@@ -250,18 +289,19 @@ class UIMDecoder310(CodecDecoder):
             # Parse Sensor Channels Contexts
             for sensorChannelsContext in sensorContext.sensorChannelsContext:
                 channels: list = []
-
+                # Identifiers shared by all channels of the context
+                input_provider_uuid: Optional[uuid.UUID] = None
+                if sensorChannelsContext.inkInputProviderID:
+                    input_provider_uuid = UIMDecoder310.__uimid__(sensorChannelsContext.inkInputProviderID)
+                input_device_uuid: uuid.UUID = UIMDecoder310.__uimid__(sensorChannelsContext.inputDeviceID)
                 # Parse Sensor Channels
                 for sensorChannel in sensorChannelsContext.channels:
-                    input_provider_uuid: Optional[uuid.UUID] = None
-                    if sensorChannelsContext.inkInputProviderID:
-                        input_provider_uuid = Identifier.from_bytes(sensorChannelsContext.inkInputProviderID)
                     if sensorChannel.type not in UIMDecoder310.MAP_CHANNEL_TYPE:
                         logger.warning(f"Unknown channel type {sensorChannel.type}")
-                        context.decoder_map['ignore'].append(Identifier.from_bytes(sensorChannel.id))
+                        context.decoder_map['ignore'].append(UIMDecoder310.__uimid__(sensorChannel.id))
                         continue
                     sensor_channel: SensorChannel = SensorChannel(
-                        Identifier.from_bytes(sensorChannel.id),
+                        UIMDecoder310.__uimid__(sensorChannel.id),
                         UIMDecoder310.MAP_CHANNEL_TYPE[sensorChannel.type],
                         UIMDecoder310.MAP_INK_METRICS_TYPE[sensorChannel.metric],
                         sensorChannel.resolution,
@@ -270,72 +310,67 @@ class UIMDecoder310(CodecDecoder):
                         sensorChannel.precision,
                         data_type=DataType.FLOAT32,
                         ink_input_provider_id=input_provider_uuid,
-                        input_device_id=Identifier.from_bytes(sensorChannelsContext.inputDeviceID)
+                        input_device_id=input_device_uuid
                     )
                     channels.append(sensor_channel)
-                # Check for input provider uuid
-                input_provider_uuid: Optional[uuid.UUID] = None
-                if sensorChannelsContext.inkInputProviderID:
-                    input_provider_uuid = Identifier.from_bytes(sensorChannelsContext.inkInputProviderID)
                 # Sensor channels context
                 sensor_channel_context: SensorChannelsContext = SensorChannelsContext(
-                    Identifier.from_bytes(sensorChannelsContext.id),
+                    UIMDecoder310.__uimid__(sensorChannelsContext.id),
                     channels,
                     sensorChannelsContext.samplingRateHint,
                     sensorChannelsContext.latency,
                     input_provider_uuid,
-                    Identifier.from_bytes(sensorChannelsContext.inputDeviceID),
+                    input_device_uuid,
                 )
                 sensor_channels_contexts.append(sensor_channel_context)
             # Sensor context
             sensor_context: SensorContext = SensorContext(
-                Identifier.from_bytes(sensorContext.id),
+                UIMDecoder310.__uimid__(sensorContext.id),
                 sensor_channels_contexts
             )
             context.ink_model.input_configuration.sensor_contexts.append(sensor_context)
 
-        # Parse Sensor Data
-        sensor_data_array: list = []
-        for sensorData in input_data.sensorData:
-            input_context: InputContext = context.ink_model.input_configuration. \
-                get_input_context(Identifier.from_bytes(sensorData.inputContextID))
+        # Parse Sensor Data, the number of sensor data sequences is known up front
+        sensor_data_array: List[Optional[SensorData]] = [None] * len(input_data.sensorData)
+        # Channels are looked up by their encoded id, thus no UUID is constructed per data channel
+        ignored_channels: set = {channel_id.bytes_le for channel_id in context.decoder_map['ignore']}
+        # Channel lookup per sensor context, shared by all sensor data referencing the context
+        channels_by_context: Dict[uuid.UUID, Dict[bytes, SensorChannel]] = {}
+        for sensor_data_idx, sensorData in enumerate(input_data.sensorData):
+            input_context_id: uuid.UUID = UIMDecoder310.__uimid__(sensorData.inputContextID)
+            input_context: InputContext = context.ink_model.input_configuration.get_input_context(input_context_id)
             sensor_ctx: SensorContext = context.ink_model.input_configuration. \
                 get_sensor_context(input_context.sensor_context_id)
+            channel_by_id: Optional[Dict[bytes, SensorChannel]] = \
+                channels_by_context.get(input_context.sensor_context_id)
+            if channel_by_id is None:
+                channel_by_id = {c.id.bytes_le: c for cs in sensor_ctx.sensor_channels_contexts for c in cs.channels}
+                channels_by_context[input_context.sensor_context_id] = channel_by_id
             # Add sensor data
             sensor_data: SensorData = SensorData(
-                Identifier.from_bytes(sensorData.id),
-                Identifier.from_bytes(sensorData.inputContextID),
+                UIMDecoder310.__uimid__(sensorData.id),
+                input_context_id,
                 UIMDecoder310.MAP_STATE_TYPE[sensorData.state],
                 sensorData.timestamp
             )
-            # Adding all channels
+            # Adding all channels at once
+            channels_data: List[Tuple[SensorChannel, list]] = []
             for dataChannel in sensorData.dataChannels:
-                identifier: uuid.UUID = Identifier.from_bytes(dataChannel.sensorChannelID)
-                if identifier in context.decoder_map['ignore']:
+                channel_id: bytes = dataChannel.sensorChannelID
+                if channel_id in ignored_channels:
                     continue
-                sensor_type: SensorChannel = sensor_ctx.get_channel_by_id(
-                    identifier
-                )
-                if sensor_type.type == InkSensorType.TIMESTAMP:
-                    ctx: SensorChannel = sensor_ctx.get_channel_by_id(
-                        Identifier.from_bytes(dataChannel.sensorChannelID)
-                    )
-                    channel_data: ChannelData = ChannelData(
-                        Identifier.from_bytes(dataChannel.sensorChannelID),
-                        CodecDecoder.__decode__(dataChannel.values, ctx.precision, ctx.resolution,
-                                                start_value=sensorData.timestamp, data_type=float),
-                    )
-                    sensor_data.add_timestamp_data(sensor_type, channel_data.values)
+                ctx: Optional[SensorChannel] = channel_by_id.get(channel_id)
+                if ctx is None:
+                    # Raises an exception for unknown channels
+                    ctx = sensor_ctx.get_channel_by_id(UIMDecoder310.__uimid__(channel_id))
+                if ctx.type == InkSensorType.TIMESTAMP:
+                    channels_data.append((ctx, CodecDecoder.__decode_timestamps__(
+                        dataChannel.values, ctx.precision, ctx.resolution, start_value=sensorData.timestamp)))
                 else:
-                    ctx: SensorChannel = sensor_ctx.get_channel_by_id(
-                        Identifier.from_bytes(dataChannel.sensorChannelID)
-                    )
-                    channel_data: ChannelData = ChannelData(
-                        Identifier.from_bytes(dataChannel.sensorChannelID),
-                        CodecDecoder.__decode__(dataChannel.values, ctx.precision, ctx.resolution),
-                    )
-                    sensor_data.add_data(sensor_type, channel_data.values)
-            sensor_data_array.append(sensor_data)
+                    channels_data.append((ctx, CodecDecoder.__decode__(dataChannel.values, ctx.precision,
+                                                                       ctx.resolution)))
+            sensor_data.add_channels_data(channels_data)
+            sensor_data_array[sensor_data_idx] = sensor_data
 
         context.ink_model.sensor_data.sensor_data = sensor_data_array
 
@@ -370,96 +405,110 @@ class UIMDecoder310(CodecDecoder):
                 p.offsetZ,
             )
             context.path_point_properties.append(path_point_properties)
+        # Functions used per stroke are bound to locals once
+        uimid = UIMDecoder310.__uimid__
+        decode_splines = UIMDecoder310.__decode_splines__
+        # Protobuf field access is resolved through descriptors, thus fields used per stroke are read once
+        brush_uris: list = ink_data.brushURIs[:]
+        render_mode_uris: list = ink_data.renderModeURIs[:]
+        properties: List[PathPointProperties] = context.path_point_properties
+        # The strokes are added to the context once all of them are decoded, thus a stroke that fails to decode
+        # leaves no placeholders behind
+        strokes: List[Optional[Stroke]] = [None] * len(ink_data.strokes)
         # Strokes
-        idx: int = 0
-        for s in ink_data.strokes:
+        for stroke_idx, s in enumerate(ink_data.strokes):
+            properties_index: int = s.propertiesIndex
+            random_seed: int = s.randomSeed
             # Check if sensor id exists
             sensor_id: Optional[uuid.UUID] = None
             if s.sensorDataID:
-                sensor_id = Identifier.from_bytes(s.sensorDataID)
+                sensor_id = uimid(s.sensorDataID)
             stroke: Stroke = Stroke(
-                sid=Identifier.from_bytes(s.id),
+                sid=uimid(s.id),
                 sensor_data_offset=s.sensorDataOffset,
                 sensor_data_id=sensor_id,
-                sensor_data_mapping=list(s.sensorDataMapping),
-                random_seed=s.randomSeed,
-                property_index=s.propertiesIndex
+                sensor_data_mapping=s.sensorDataMapping[:],
+                random_seed=random_seed,
+                property_index=properties_index
             )
             stroke.start_parameter = s.startParameter
             stroke.end_parameter = s.endParameter
-            if len(s.splineData.splineX) > 0:
-                splines: uim_3_1_0.Stroke.SplineData = s.splineData
-                spline_x: list = list(splines.splineX)
-                spline_y: list = list(splines.splineY)
-                spline_z: list = list(splines.splineZ)
-                sizes: list = list(splines.size)
-                rotation: list = list(splines.rotation)
-                scale_x: list = list(splines.scaleX)
-                scale_y: list = list(splines.scaleY)
-                scale_z: list = list(splines.scaleZ)
-                offset_x: list = list(splines.offsetX)
-                offset_y: list = list(splines.offsetY)
-                offset_z: list = list(splines.offsetZ)
-                list_red: list = list(splines.red)
-                list_green: list = list(splines.green)
-                list_blue: list = list(splines.blue)
-                list_alpha: list = list(splines.alpha)
+            spline_data: uim_3_1_0.Stroke.SplineData = s.splineData
+            if len(spline_data.splineX) > 0:
+                splines: uim_3_1_0.Stroke.SplineData = spline_data
+                # Slicing copies the repeated fields in bulk, list() would iterate them element by element
+                stroke.__set_splines__((
+                    splines.splineX[:],
+                    splines.splineY[:],
+                    splines.splineZ[:],
+                    splines.size[:],
+                    splines.rotation[:],
+                    splines.scaleX[:],
+                    splines.scaleY[:],
+                    splines.scaleZ[:],
+                    splines.offsetX[:],
+                    splines.offsetY[:],
+                    splines.offsetZ[:]
+                ))
+                list_red: list = splines.red[:]
+                list_green: list = splines.green[:]
+                list_blue: list = splines.blue[:]
+                list_alpha: list = splines.alpha[:]
             else:
                 splines: uim_3_1_0.Stroke.SplineCompressed = s.splineCompressed
                 scheme: PrecisionScheme = PrecisionScheme()
                 if s.precisions:
                     scheme.value = s.precisions
-                spline_x: list = CodecDecoder.__decode__(list(splines.splineX), precision=scheme.position_precision)
-                spline_y: list = CodecDecoder.__decode__(list(splines.splineY), precision=scheme.position_precision)
-                spline_z: list = CodecDecoder.__decode__(list(splines.splineZ), precision=scheme.position_precision)
-                sizes: list = CodecDecoder.__decode__(list(splines.size), precision=scheme.size_precision)
-                rotation: list = CodecDecoder.__decode__(list(splines.rotation), precision=scheme.rotation_precision)
-                scale_x: list = CodecDecoder.__decode__(list(splines.scaleX), precision=scheme.scale_precision)
-                scale_y: list = CodecDecoder.__decode__(list(splines.scaleY), precision=scheme.scale_precision)
-                scale_z: list = CodecDecoder.__decode__(list(splines.scaleZ), precision=scheme.scale_precision)
-                offset_x: list = CodecDecoder.__decode__(list(splines.offsetX), precision=scheme.offset_precision)
-                offset_y: list = CodecDecoder.__decode__(list(splines.offsetY), precision=scheme.offset_precision)
-                offset_z: list = CodecDecoder.__decode__(list(splines.offsetZ), precision=scheme.offset_precision)
-                list_red: list = list(splines.red)
-                list_green: list = list(splines.green)
-                list_blue: list = list(splines.blue)
-                list_alpha: list = list(splines.alpha)
+                position_precision: int = scheme.position_precision
+                scale_precision: int = scheme.scale_precision
+                offset_precision: int = scheme.offset_precision
+                # The delta encoded values are copied now, decoding is deferred until the stroke is read
+                stroke.__defer_splines__(partial(decode_splines, (
+                    (splines.splineX[:], position_precision),
+                    (splines.splineY[:], position_precision),
+                    (splines.splineZ[:], position_precision),
+                    (splines.size[:], scheme.size_precision),
+                    (splines.rotation[:], scheme.rotation_precision),
+                    (splines.scaleX[:], scale_precision),
+                    (splines.scaleY[:], scale_precision),
+                    (splines.scaleZ[:], scale_precision),
+                    (splines.offsetX[:], offset_precision),
+                    (splines.offsetY[:], offset_precision),
+                    (splines.offsetZ[:], offset_precision)
+                )))
+                list_red: list = splines.red[:]
+                list_green: list = splines.green[:]
+                list_blue: list = splines.blue[:]
+                list_alpha: list = splines.alpha[:]
                 stroke.precision_scheme = scheme
-            stroke.splines_x = spline_x
-            stroke.splines_y = spline_y
-            stroke.splines_z = spline_z
-            stroke.sizes = sizes
-            stroke.rotations = rotation
-            stroke.scales_x = scale_x
-            stroke.scales_y = scale_y
-            stroke.scales_z = scale_z
-            stroke.offsets_x = offset_x
-            stroke.offsets_y = offset_y
-            stroke.offsets_z = offset_z
             stroke.red = list_red
             stroke.green = list_green
             stroke.blue = list_blue
             stroke.alpha = list_alpha
             props: Optional[PathPointProperties] = None
             brush: Optional[str] = None
-            if s.brushURIIndex:
-                brush_index: int = s.brushURIIndex - 1
-                brush = ink_data.brushURIs[brush_index]
-            if s.propertiesIndex:
-                props = context.path_point_properties[s.propertiesIndex - 1]
+            brush_uri_index: int = s.brushURIIndex
+            if brush_uri_index:
+                brush = brush_uris[brush_uri_index - 1]
+            if properties_index:
+                props = properties[properties_index - 1]
             # Set style
-            stroke.style = Style(properties=props, brush_uri=brush, particles_random_seed=s.randomSeed)
-            if s.renderModeURIIndex > 0:
-                stroke.style.render_mode_uri = ink_data.renderModeURIs[s.renderModeURIIndex - 1]
-            idx += 1
-            context.strokes.append(stroke)
+            style: Style = Style(properties=props, brush_uri=brush, particles_random_seed=random_seed)
+            render_mode_uri_index: int = s.renderModeURIIndex
+            if render_mode_uri_index > 0:
+                style.render_mode_uri = render_mode_uris[render_mode_uri_index - 1]
+            stroke.style = style
+            strokes[stroke_idx] = stroke
+        context.strokes.extend(strokes)
         # Unit scale
         context.ink_model.unit_scale_factor = ink_data.unitScaleFactor
+        # The sub-message is fetched once, not once per matrix element
+        t: uim_3_1_0.Matrix = ink_data.transform
         context.ink_model.transform = [
-            [ink_data.transform.m00, ink_data.transform.m01, ink_data.transform.m02, ink_data.transform.m03],
-            [ink_data.transform.m10, ink_data.transform.m11, ink_data.transform.m12, ink_data.transform.m13],
-            [ink_data.transform.m20, ink_data.transform.m21, ink_data.transform.m22, ink_data.transform.m23],
-            [ink_data.transform.m30, ink_data.transform.m31, ink_data.transform.m32, ink_data.transform.m33]
+            [t.m00, t.m01, t.m02, t.m03],
+            [t.m10, t.m11, t.m12, t.m13],
+            [t.m20, t.m21, t.m22, t.m23],
+            [t.m30, t.m31, t.m32, t.m33]
         ]
         # if the transform is not set, set it to identity
         if (context.ink_model.transform == 0).all():
@@ -477,8 +526,8 @@ class UIMDecoder310(CodecDecoder):
         triple_store: TripleStore
             triple_store protobuf message 'TripleStore'
         """
-        for statement in triple_store.statements:
-            context.ink_model.add_semantic_triple(statement.subject, statement.predicate, statement.object)
+        context.ink_model.add_semantic_triples((statement.subject, statement.predicate, statement.object)
+                                               for statement in triple_store.statements)
 
     @classmethod
     def parse_ink_structure(cls, context: DecoderContext, ink_structure: uim_3_1_0.InkStructure):
@@ -530,37 +579,47 @@ class UIMDecoder310(CodecDecoder):
         if one_of == 'index':
             raise FormatException("Invalid tree root type")
         root_id: bytes = getattr(proto_tree.tree[0], one_of)
-        prev_node: StrokeGroupNode = StrokeGroupNode(Identifier.from_bytes(root_id))
+        prev_node: StrokeGroupNode = StrokeGroupNode(UIMDecoder310.__uimid__(root_id))
         tree.root = prev_node
-        if proto_tree.tree[0].bounds:
+        if proto_tree.tree[0].HasField('bounds'):
             tree.root.group_bounding_box = UIMDecoder310.__extract_bounding_box__(proto_tree.tree[0].bounds)
         # Parent
         parent: StrokeGroupNode = tree.root
+        # Depth of the parent, kept in sync with the stack instead of recomputing its length per node
+        depth: int = 0
+        # Functions and lists used per node are bound to locals once
+        uimid = UIMDecoder310.__uimid__
+        extract_bounding_box = UIMDecoder310.__extract_bounding_box__
+        strokes: List[Stroke] = context.strokes
+        num_strokes: int = len(strokes)
         # Iterate over all children of root
-        for node_idx in range(1, len(proto_tree.tree)):
-            node: uim_3_1_0.Node = proto_tree.tree[node_idx]
-            if node.depth > len(stack):
+        for node in proto_tree.tree[1:]:
+            node_depth: int = node.depth
+            if node_depth > depth:
                 stack.append(parent)
                 parent = prev_node
-            elif node.depth < len(stack):
-                while node.depth < len(stack):
+                depth += 1
+            elif node_depth < depth:
+                for _ in range(depth - node_depth):
                     parent = stack.pop()
+                depth = node_depth
 
             one_of: str = node.WhichOneof("id")
             value: Any = getattr(node, one_of)
-            bbox: BoundingBox = UIMDecoder310.__extract_bounding_box__(node.bounds)
+            # Sub-messages are never falsy, thus the presence of the bounds is checked explicitly
+            bbox: BoundingBox = extract_bounding_box(node.bounds if node.HasField('bounds') else None)
             # Handle different node types
             if one_of == 'groupID':  # Stroke Group Node
-                group_id: uuid.UUID = Identifier.from_bytes(value)
+                group_id: uuid.UUID = uimid(value)
                 new_node: StrokeGroupNode = StrokeGroupNode(group_id)
                 new_node.group_bounding_box = bbox
                 # remember current node
                 prev_node = new_node
             else:  # Stroke Node
                 index: int = value
-                if index > len(context.strokes):
+                if index >= num_strokes:
                     raise FormatException(f"Reference stroke with index:= {index} does not exist in UIM.")
-                stroke: Stroke = context.strokes[index]
+                stroke: Stroke = strokes[index]
                 fragment: Optional[StrokeFragment] = None
                 # Fragment
                 if node.interval.toIndex > 0:
@@ -594,32 +653,29 @@ class UIMDecoder310(CodecDecoder):
             compression_type: `CompressionType
                 Type of compression used for encoding the content.
         """
-        chunk_major_version: int = int.from_bytes(content[0:1], byteorder='big')
-        chunk_minor_version: int = int.from_bytes(content[1:2], byteorder='big')
-        chunk_patch_version: int = int.from_bytes(content[2:3], byteorder='big')
-        content_type: bytes = content[3:4]
-        compression_type: bytes = content[4:5]
+        chunk_major_version, chunk_minor_version, chunk_patch_version, content_type, compression_type = \
+            CHUNK_DESCRIPTION_STRUCT.unpack_from(content)
         return chunk_major_version, chunk_minor_version, chunk_patch_version, \
             UIMDecoder310.MAP_CONTENT_TYPE[content_type], UIMDecoder310.MAP_COMPRESSION_TYPE[compression_type]
 
     @staticmethod
-    def __extract_bounding_box__(rect: uim_3_1_0.Rectangle) -> BoundingBox:
+    def __extract_bounding_box__(rect: Optional[uim_3_1_0.Rectangle]) -> BoundingBox:
         """
         Extract bounding box.
 
         Parameters
         ----------
-        rect: uim_3_1_0.Rectangle
-            Protobuf structure for rectangle
+        rect: Optional[uim_3_1_0.Rectangle]
+            Protobuf structure for rectangle, None if the node has no bounds
 
         Returns
         -------
         bounding_box: BoundingBox
-            Bounding box
+            Bounding box, the shared `EMPTY_BOUNDING_BOX` if no rectangle is given
         """
-        if rect:
+        if rect is not None:
             return BoundingBox(rect.x, rect.y, rect.width, rect.height)
-        return BoundingBox(0., 0., 0., 0.)
+        return EMPTY_BOUNDING_BOX
 
     @staticmethod
     def __read_size__(riff: BytesIO) -> int:
@@ -634,24 +690,93 @@ class UIMDecoder310(CodecDecoder):
         -------
         size: int
             Size of the chunk
+
+        Raises
+        ------
+        FormatException
+            If the stream ends before the size of the chunk.
         """
-        return ctypes.c_uint32(int.from_bytes(riff.read(4), byteorder='little')).value
+        try:
+            return CHUNK_SIZE_STRUCT.unpack(riff.read(CHUNK_SIZE_STRUCT.size))[0]
+        except struct.error as e:
+            raise FormatException('Unexpected end of stream while reading the chunk size.') from e
+
+    @staticmethod
+    def __decode_splines__(encoded: Tuple[Tuple[List[int], int], ...]) -> Tuple[List[float], ...]:
+        """
+        Decode the delta encoded spline values of a stroke.
+
+        Parameters
+        ----------
+        encoded: Tuple[Tuple[List[int], int], ...]
+            Pairs of delta encoded values and their precision
+
+        Returns
+        -------
+        values: Tuple[List[float], ...]
+            Decoded values, in the order of `encoded`
+        """
+        decode = CodecDecoder.__decode__
+        return tuple(decode(values, precision=precision) for values, precision in encoded)
+
+    @staticmethod
+    def __parse_chunk__(chunk: Tuple[bytes, Union[bytes, memoryview]]) -> Any:
+        """
+        Parse the content of a chunk into its protobuf message.
+
+        Parameters
+        ----------
+        chunk: Tuple[bytes, Union[bytes, memoryview]]
+            Chunk id and decoded content of the chunk
+
+        Returns
+        -------
+        message: Any
+            Parsed protobuf message
+        """
+        chunk_id, content = chunk
+        # Fresh message per chunk, shared instances would keep the last document alive and are not thread-safe
+        message: Any = UIMDecoder310.MAP_CHUNK_TYPE[chunk_id]()
+        message.ParseFromString(content)
+        return message
+
+    @staticmethod
+    def __chunk_buffer__(riff: Union[BytesIO, mmap.mmap]) -> Optional[memoryview]:
+        """
+        Buffer view of the RIFF content, used to hand chunks to the protobuf parser without copying them.
+
+        Parameters
+        ----------
+        riff: Union[BytesIO, mmap.mmap]
+            RIFF content
+
+        Returns
+        -------
+        buffer: Optional[memoryview]
+            View of the whole content; None if the stream does not expose its buffer.
+        """
+        if isinstance(riff, BytesIO):
+            return riff.getbuffer()
+        if isinstance(riff, mmap.mmap):
+            return memoryview(riff)
+        return None
 
     @classmethod
-    def __decode_uim_chunk__(cls, content: bytes, compression: CompressionType) -> bytes:
+    def __decode_uim_chunk__(cls, content: Union[bytes, memoryview], compression: CompressionType) \
+            -> Union[bytes, memoryview]:
         """
         Decode the UIM chunk.
 
         Parameters
         ----------
-        content: bytes
+        content: Union[bytes, memoryview]
             Content of the chunk
         compression: CompressionType
             Type of compression used for encoding the content.
 
         Returns
         -------
-        bytes
+        Union[bytes, memoryview]
             Decoded content
 
         Raises
@@ -664,13 +789,13 @@ class UIMDecoder310(CodecDecoder):
         return content
 
     @classmethod
-    def decode(cls, riff: BytesIO, size_head: int):
+    def decode(cls, riff: Union[BytesIO, mmap.mmap], size_head: int):
         """
        Decoding Universal Ink Model (RIFF / Protobuf encoded) content file.
 
        Parameters
        ----------
-       riff: `BytesIO`
+       riff: `Union[BytesIO, mmap.mmap]`
            RIFF content with encoded UIM v3.1.0 content.
        size_head: `int`
            Size of  the header
@@ -680,44 +805,61 @@ class UIMDecoder310(CodecDecoder):
            model - `InkModel`
                Parsed `InkModel` from UIM v3.1.0 ink content
        """
-        # Reserved byte after version
-        _ = riff.read(1)
-        num_chunks: int = int((size_head - 4) / 8)
-        chunk_desc: list = []
-        # Collect the description of the chunks
-        for _ in range(num_chunks):
-            chunk_desc.append(UIMDecoder310.four_cc(riff.read(CHUNK_DESCRIPTION)))
-        # Content parser
-        uim_content_parser: UIMDecoder310 = UIMDecoder310()
-        context: DecoderContext = DecoderContext(version=SupportedFormats.UIM_VERSION_3_1_0.value,
-                                                 ink_model=InkModel(SupportedFormats.UIM_VERSION_3_1_0.value))
-        # Iterate over chunks
-        for j in range(num_chunks):
-            desc: list = chunk_desc[j]
-            chunk_id = riff.read(CHUNK_ID_BYTES_SIZE)
-            chunk_data_length: int = UIMDecoder310.__read_size__(riff)
-            chunk_content: bytes = riff.read(chunk_data_length)
-            if desc[0] == 3 and desc[1] == 1 and desc[2] == 0:
-                if desc[3] == ContentType.PROTOBUF:
-                    message: bytes = UIMDecoder310.__decode_uim_chunk__(chunk_content, desc[4])
-                    if chunk_id in UIMDecoder310.MAP_CHUNK_TYPE:
-                        protobuf_type = UIMDecoder310.MAP_CHUNK_TYPE[chunk_id]
-                        protobuf_type.ParseFromString(message)
-                        if chunk_id == PROPERTIES_HEADER:
-                            uim_content_parser.parse_properties(context, protobuf_type)
-                        elif chunk_id == INPUT_DATA_HEADER:
-                            uim_content_parser.parse_input_data(context, protobuf_type)
-                        elif chunk_id == BRUSHES_HEADER:
-                            uim_content_parser.parse_brushes(context, protobuf_type)
-                        elif chunk_id == INK_DATA_HEADER:
-                            uim_content_parser.parse_ink_data(context, protobuf_type)
-                        elif chunk_id == KNOWLEDGE_HEADER:
-                            uim_content_parser.parse_knowledge(context, protobuf_type)
-                        elif chunk_id == INK_STRUCTURE_HEADER:
-                            uim_content_parser.parse_ink_structure(context, protobuf_type)
+        # Chunks are parsed from views of the content, thus the largest chunks are not copied before parsing
+        buffer: Optional[memoryview] = UIMDecoder310.__chunk_buffer__(riff)
+        chunk_content: Union[bytes, memoryview, None] = None
+        # Content of the chunks with a parser, in the order of the file
+        chunks: List[Tuple[bytes, Union[bytes, memoryview]]] = []
+        try:
+            # Reserved byte after version
+            _ = riff.read(1)
+            num_chunks: int = int((size_head - 4) / 8)
+            chunk_desc: list = []
+            # Collect the description of the chunks
+            for _ in range(num_chunks):
+                chunk_desc.append(UIMDecoder310.four_cc(riff.read(CHUNK_DESCRIPTION)))
+            # Content parser
+            uim_content_parser: UIMDecoder310 = UIMDecoder310()
+            context: DecoderContext = DecoderContext(version=SupportedFormats.UIM_VERSION_3_1_0.value,
+                                                     ink_model=InkModel(SupportedFormats.UIM_VERSION_3_1_0.value))
+            # Iterate over chunks
+            for j in range(num_chunks):
+                desc: list = chunk_desc[j]
+                chunk_id = riff.read(CHUNK_ID_BYTES_SIZE)
+                chunk_data_length: int = UIMDecoder310.__read_size__(riff)
+                if buffer is not None:
+                    position: int = riff.tell()
+                    chunk_content = buffer[position:position + chunk_data_length]
+                    riff.seek(len(chunk_content), SEEK_CUR)
                 else:
-                    raise FormatException('Only protobuf decoding is supported.')
-            # Check if padding byte is set
-            if chunk_data_length % 2 != 0:
-                riff.read(1)
-        return context.ink_model
+                    chunk_content = riff.read(chunk_data_length)
+                if desc[0] == 3 and desc[1] == 1 and desc[2] == 0:
+                    if desc[3] == ContentType.PROTOBUF:
+                        if chunk_id in UIMDecoder310.MAP_CHUNK_PARSER:
+                            chunks.append((chunk_id, UIMDecoder310.__decode_uim_chunk__(chunk_content, desc[4])))
+                            # The content is released with the collected chunks
+                            chunk_content = None
+                    else:
+                        raise FormatException('Only protobuf decoding is supported.')
+                if isinstance(chunk_content, memoryview):
+                    # View of a chunk without parser
+                    chunk_content.release()
+                # Check if padding byte is set
+                if chunk_data_length % 2 != 0:
+                    riff.read(1)
+            # Parsed on demand, only one message is kept in memory
+            messages: Iterable[Any] = map(UIMDecoder310.__parse_chunk__, chunks)
+            # The messages are applied to the context in the order of the file
+            for (chunk_id, _), message in zip(chunks, messages):
+                getattr(uim_content_parser, UIMDecoder310.MAP_CHUNK_PARSER[chunk_id])(context, message)
+            return context.ink_model
+        finally:
+            # Views must be released, otherwise the stream can be neither resized nor closed
+            if isinstance(chunk_content, memoryview):
+                chunk_content.release()
+            for _, content in chunks:
+                if isinstance(content, memoryview):
+                    content.release()
+            if buffer is not None:
+                buffer.release()
+            UIMDecoder310.__uimid__.cache_clear()
@@ -19,11 +19,13 @@ import re
 import sys
 import time
 import uuid
+import warnings
+from collections import deque
 from io import BytesIO
-from typing import Any, List, Dict, Tuple, Optional, Union
-from xml.etree.ElementTree import tostring
+from typing import Any, List, Dict, Tuple, Optional, Union, Iterable, Iterator
 
 import dateutil.parser
+import numpy as np
 from lxml import etree
 from lxml.etree import Element
 
@@ -33,6 +35,7 @@ import uim.model.inkinput.sensordata as sensor
 import uim.model.semantics.schema as semantics
 from uim import logger
 from uim.codec.context.decoder import DecoderContext
+from uim.codec.context.scheme import PrecisionScheme
 from uim.codec.parser.base import FormatException, Parser, SupportedFormats
 from uim.model import UUIDIdentifier
 from uim.model.inkdata.brush import BrushPolygonUri, VectorBrush, Brush
@@ -46,6 +49,7 @@ ANNOTATION_TYPE: str = 'type'
 ANNOTATION_VALUE: str = 'value'
 # ---------------------------------- InkML standard tags ---------------------------------------------------------------
 XML_NAMESPACE_ID: str = '{http://www.w3.org/XML/1998/namespace}ID'
+XML_ID: str = '{http://www.w3.org/XML/1998/namespace}id'
 VALUE: str = 'value'
 TIME_STRING: str = 'timeString'
 NAME: str = 'name'
@@ -82,6 +86,10 @@ IDENTIFIER: str = 'id'
 # ---------------------------------- Parsing elements ------------------------------------------------------------------
 STROKE_IDS: str = 'stroke_ids'
 SEMANTICS: str = 'semantics'
+CHANNELS_BY_TYPE: str = 'channels_by_type'
+COLUMN_CONVERSIONS: str = 'column_conversions'
+# Line breaks become spaces, carriage returns and tabs are removed
+WHITESPACE_TRANSLATION: Dict[int, Optional[int]] = {ord('\n'): ord(' '), ord('\r'): None, ord('\t'): None}
 
 
 class InkMLParserException(FormatException):
@@ -94,6 +102,11 @@ def xml_id(element: Element) -> str:
         XML element
     :return : extracted xml id as string
     """
+    # Probe the common spellings directly, before scanning all attributes
+    for key in (XML_ID, IDENTIFIER, XML_NAMESPACE_ID):
+        val: Optional[str] = element.get(key)
+        if val is not None:
+            return val
     for el, val in element.attrib.items():
         if IDENTIFIER in el.lower():
             return str(val)
@@ -106,8 +119,8 @@ def stringify_children(element: Element):
         XML element
     :return : concatenate all children as string
     """
-    content: bytes = tostring(element.getchildren()[0])
-    return content.decode("utf-8").replace('\n', ' ').replace('\r', '').replace('\t', '').strip()
+    content: str = etree.tostring(element[0], encoding='unicode', with_tail=False)
+    return content.translate(WHITESPACE_TRANSLATION).strip()
 
 
 def reference_id(ref_id: str) -> str:
@@ -125,6 +138,28 @@ def reference_id(ref_id: str) -> str:
     return str(ref_id)[1:] if str(ref_id).startswith('#') else str(ref_id)
 
 
+def parse_time_string(time_string: str) -> datetime.datetime:
+    """Parse a time string.
+
+    ISO 8601 time strings are parsed with `datetime.fromisoformat`, other formats fall back to `dateutil`.
+
+    Parameters
+    ----------
+    time_string: str
+        Time string
+    Returns
+    -------
+    datetime.datetime
+        Parsed date and time
+    """
+    try:
+        if time_string.endswith('Z'):
+            return datetime.datetime.fromisoformat(f'{time_string[:-1]}+00:00')
+        return datetime.datetime.fromisoformat(time_string)
+    except ValueError:
+        return dateutil.parser.parse(time_string)
+
+
 class InkMLParser(Parser):
     """
     InkML Parser
@@ -180,14 +215,36 @@ class InkMLParser(Parser):
     FORCE_CHANNEL_NAME: str = "F"
     WIDTH_CHANNEL_NAME: str = "F"
     SEPARATION_CHAR: str = ','
-
-    """Conversion function for data types"""
-    TYPES_CONVERSION_FUNCTIONS: Dict[device.DataType, Union[int, float, bool]] = {
-        device.DataType.FLOAT32: float,
-        device.DataType.INT32: int,
-        device.DataType.INT64: int,
-        device.DataType.FLOAT64: float,
-        device.DataType.BOOLEAN: lambda x: True if x == 'T' else False
+    MODIFIERS: Tuple[str, str, str] = (EXPLICIT_VALUE_MODIFIER, SINGLE_DIFFERENCE_MODIFIER, SECOND_DIFFERENCE_MODIFIER)
+    # Channels which are added to the sensor data
+    SAMPLE_CHANNEL_TYPES: Tuple[device.InkSensorType, ...] = (
+        device.InkSensorType.X, device.InkSensorType.Y, device.InkSensorType.TIMESTAMP, device.InkSensorType.PRESSURE,
+        device.InkSensorType.Z, device.InkSensorType.AZIMUTH, device.InkSensorType.ALTITUDE
+    )
+    # Conversion factor of the spline coordinates from meter to DIP
+    M_TO_DIP: float = device.unit2unit(device.Unit.M, device.Unit.DIP, 1.)
+    # Conversion factor of every unit to its SI unit
+    SI_UNIT_SCALES: Dict[device.Unit, float] = {
+        unit: device.unit2unit(unit, device.si_unit(unit), 1.) for unit in device.Unit
+    }
+    # Characters of traces with plain explicit values, separators and whitespace delimit the values
+    PLAIN_TRACE_CHARS: bytes = b'0123456789-., \t\n\r'
+    VALUE_DELIMITERS: np.ndarray = np.zeros(256, dtype=bool)
+    VALUE_DELIMITERS[list(b', \t\n\r')] = True
+    SAMPLE_TOKEN_REGEX: re.Pattern = re.compile(rb"[,!'\"]|-?(?:\d+(?:\.\d+)?|\.\d+)")
+    # Tokens are matched on the UTF-8 encoded trace data and classified by their first byte
+    SEPARATION_CODE: int = ord(SEPARATION_CHAR)
+    """Index into MODIFIERS for the first byte of a token, -1 if the token is not a modifier."""
+    MODIFIER_CODES: np.ndarray = np.full(256, -1, dtype=np.int8)
+    MODIFIER_CODES[[ord(m) for m in MODIFIERS]] = np.arange(len(MODIFIERS))
+
+    """Numpy data types for the channel data types. Floating point channels are parsed as double."""
+    NUMPY_DATA_TYPES: Dict[device.DataType, type] = {
+        device.DataType.FLOAT32: np.float64,
+        device.DataType.INT32: np.int64,
+        device.DataType.INT64: np.int64,
+        device.DataType.FLOAT64: np.float64,
+        device.DataType.BOOLEAN: np.bool_
     }
 
     """Prefix for the node uri."""
@@ -337,6 +394,11 @@ class InkMLParser(Parser):
     # Artificial timestamps
     ARTIFICIAL_TS_TAG: str = 'artificial_ts'
     DEVICE_CONFIGURATION_FOUND = 'device_configuration_found'
+    # Quantization of spline coordinates
+    SPLINE_PRECISION_TAG: str = 'spline_precision'
+    # Spline buffers and their extrema of the registered strokes, the coordinates are converted to lists once all
+    # traces are collected
+    STROKE_SPLINES_TAG: str = 'stroke_splines'
     # Context
     CONTEXT_TAG: str = 'context'
     CURRENT_CONTEXT_TAG: str = 'current_context'
@@ -360,6 +422,7 @@ class InkMLParser(Parser):
         self.__default_device_properties: Dict[str, str] = {}
         self.__default_position_precision: int = 2
         self.__default_value_resolution: float = 1.
+        self.__spline_precision: Optional[int] = None
         self.__default_annotation_type: Optional[str] = None
         self.__use_brush: str = InkMLParser.BRUSH_URI
         self.DEFAULT_UNIT[device.InkSensorType.X] = device.Unit.DIP
@@ -468,6 +531,19 @@ class InkMLParser(Parser):
     def default_value_resolution(self, resolution: float):
         self.__default_value_resolution = resolution
 
+    @property
+    def spline_precision(self) -> Optional[int]:
+        """
+        Decimal precision of the spline coordinates in DIP. (Optional[int], Default: None). If set, the coordinates are
+        quantized to this grid while parsing and the strokes carry the matching precision scheme, so the encoder
+        stores them as integers without rounding them again, e.g., DEFAULT_PRECISION[InkSensorType.X].
+        """
+        return self.__spline_precision
+
+    @spline_precision.setter
+    def spline_precision(self, precision: Optional[int]):
+        self.__spline_precision = precision
+
     @property
     def default_device_properties(self) -> Dict[str, str]:
         """Default device properties. (Dict[str, str])"""
@@ -607,24 +683,8 @@ class InkMLParser(Parser):
         if model:
             self.__default_device_properties[semantics.DEVICE_MODEL_PROPERTY] = model
 
-    @staticmethod
-    def __cast__(r_type: device.DataType, value: str) -> Any:
-        """Cast value to data type.
-        Parameters
-        ----------
-        r_type: DataType
-            Type from InkML
-        value: str
-            Value as string
-        Returns
-        -------
-        value: Any
-            Cast to appropriate data codec
-        """
-        return InkMLParser.TYPES_CONVERSION_FUNCTIONS[r_type](value)
-
     @classmethod
-    def __parse_samples__(cls, context: DecoderContext, tr_id: str, tr_ctx_id: str, trace_data: str,
+    def __parse_samples__(cls, context: DecoderContext, tr_id: str, tr_ctx_id: str, trace_data: Union[str, bytes],
                           time_offset: int = 0, default_value_resolution: float = 1., hover: bool = False):
         """Parse samples (traces) from InkML file.
 
@@ -636,8 +696,8 @@ class InkMLParser(Parser):
             Trace id
         tr_ctx_id: str
             Trace context id
-        trace_data: str
-            Trace data
+        trace_data: Union[str, bytes]
+            Trace data, either as string or UTF-8 encoded
         time_offset: int (optional) [default: 0]
             Time offset
         default_value_resolution: float (optional) [default: 1.]
@@ -654,18 +714,6 @@ class InkMLParser(Parser):
         z_index: int = 0
         azimuth_index: int = 0
         altitude_index: int = 0
-        xs: List[float] = []
-        ys: List[float] = []
-        spline_x: List[float] = []
-        spline_y: List[float] = []
-        fs: List[float] = []
-        ts: List[float] = []
-        zs: List[float] = []
-        azimuth: List[float] = []
-        altitude: List[float] = []
-
-        regex: re.Pattern[str] = re.compile(r"-?\d+(?:\.\d+)?|'[^']*'|\"[^\"]*\"")
-
         # Current context
         current: str = context.decoder_map[InkMLParser.CURRENT_CONTEXT_TAG]
         # If there is a reference timestamp set
@@ -678,13 +726,12 @@ class InkMLParser(Parser):
             ctx: dict = context.decoder_map[InkMLParser.CONTEXT_TAG][current]
         else:
             ctx: dict = context.decoder_map[InkMLParser.CONTEXT_TAG][InkMLParser.DEFAULT_CONTEXT_TAG]
+        channels_by_type: Dict[device.InkSensorType, Dict[str, Any]] = ctx[CHANNELS_BY_TYPE]
         # Timestamp
-        channel_timestamp: dict = InkMLParser.__context_get__(ctx[CHANNELS], device.InkSensorType.TIMESTAMP)
+        channel_timestamp: dict = channels_by_type.get(device.InkSensorType.TIMESTAMP)
         # Pen Orientation
-        channel_azimuth: dict = InkMLParser.__context_get__(ctx[CHANNELS], device.InkSensorType.AZIMUTH)
-        channel_altitude: dict = InkMLParser.__context_get__(ctx[CHANNELS], device.InkSensorType.ALTITUDE)
-        # At minimum we have two channels: x,y coordinates
-        num_channels: int = 2
+        channel_azimuth: dict = channels_by_type.get(device.InkSensorType.AZIMUTH)
+        channel_altitude: dict = channels_by_type.get(device.InkSensorType.ALTITUDE)
         if channel_timestamp:
             t_index = channel_timestamp[INDEX]
             # Relative timestamp with respect to reference timestamp
@@ -693,35 +740,78 @@ class InkMLParser(Parser):
                 ref: str = reference_id(channel_timestamp[RESPECT_TO])
                 if InkMLParser.REFERENCE_TIMESTAMP in ctx:
                     reference_timestamp = ctx[InkMLParser.REFERENCE_TIMESTAMP][ref]
-            num_channels += 1
-        channel_force = InkMLParser.__context_get__(ctx[CHANNELS], device.InkSensorType.PRESSURE)
+        channel_force = channels_by_type.get(device.InkSensorType.PRESSURE)
         # Handle force, if available
         if channel_force:
             f_index = channel_force[INDEX]
-            num_channels += 1
         # Handle z, if available
-        channel_z: dict = InkMLParser.__context_get__(ctx[CHANNELS], device.InkSensorType.Z)
+        channel_z: dict = channels_by_type.get(device.InkSensorType.Z)
         if channel_z:
             z_index = channel_z[INDEX]
-            num_channels += 1
         # Handle azimuth, if available
         if channel_azimuth:
             azimuth_index = channel_azimuth[INDEX]
-            num_channels += 1
         # Handle altitude, if available
         if channel_altitude:
             altitude_index = channel_altitude[INDEX]
-            num_channels += 1
-        # Strip data
-        points_data: List[str] = InkMLParser.__clean__(trace_data).split(InkMLParser.SEPARATION_CHAR)
-        modifier: str = InkMLParser.EMPTY_MODIFIER
-        last_values: List[float] = []
-        difference_vector: List[float] = [0 for _ in range(num_channels)]
-        last_differences: list = difference_vector[:]
-        last_modifier = modifier
-        point_index: int = 1
-        channel_x: dict = InkMLParser.__context_get__(ctx[CHANNELS], device.InkSensorType.X)
-        channel_y: dict = InkMLParser.__context_get__(ctx[CHANNELS], device.InkSensorType.Y)
+        channel_x: dict = channels_by_type.get(device.InkSensorType.X)
+        channel_y: dict = channels_by_type.get(device.InkSensorType.Y)
+        if isinstance(trace_data, str):
+            trace_data = trace_data.encode('utf-8')
+        # Traces with plain explicit values are converted directly, all other traces are tokenized
+        plain_values: Optional[Tuple[np.ndarray, np.ndarray]] = InkMLParser.__plain_values__(trace_data)
+        modifiers_found: bool = False
+        if plain_values is not None:
+            values, value_rows = plain_values
+        else:
+            # Scan the whole trace at once, the tokens are separators, modifiers and values
+            tokens: np.ndarray = np.array(InkMLParser.SAMPLE_TOKEN_REGEX.findall(trace_data), dtype=np.bytes_)
+            # A token is classified by its first character, separators and modifiers are single characters
+            first_chars: np.ndarray = tokens.view(np.uint8)[::tokens.itemsize]
+            separators: np.ndarray = first_chars == InkMLParser.SEPARATION_CODE
+            token_codes: np.ndarray = InkMLParser.MODIFIER_CODES[first_chars]
+            modifiers: np.ndarray = token_codes >= 0
+            modifiers_found = bool(modifiers.any())
+            value_positions: np.ndarray = np.flatnonzero(~(separators | modifiers))
+            # Sample index of each value, segments without values, e.g., a trailing separator, are skipped
+            value_rows: np.ndarray = np.cumsum(separators)[value_positions]
+            # Convert all values of the trace at once
+            values: np.ndarray = tokens[value_positions].astype(np.float64)
+        if values.size == 0:
+            raise InkMLParserException(f'Trace:={tr_id} contains no samples.')
+        row_start: np.ndarray = np.flatnonzero(np.diff(value_rows, prepend=-1))
+        widths: np.ndarray = np.diff(row_start, append=value_rows.size)
+        num_points: int = row_start.size
+        # A sample is a row and a channel a column
+        lengths: Optional[np.ndarray] = None
+        if (widths == widths[0]).all():
+            samples: np.ndarray = values.reshape(num_points, int(widths[0]))
+        else:
+            # Samples with a different number of channel values are padded
+            samples: np.ndarray = np.zeros((num_points, int(widths.max())), dtype=np.float64)
+            lengths = widths
+            samples[np.repeat(np.arange(num_points), widths),
+                    np.arange(values.size) - np.repeat(row_start, widths)] = values
+            required: int = max(x_index, y_index, f_index, z_index, azimuth_index, altitude_index)
+            if int(lengths.min()) <= required:
+                raise InkMLParserException(f'Trace:={tr_id} contains samples with missing channel values.')
+        # The conversion of the columns only depends on the context, it is prepared once per number of columns
+        device_configuration_found: bool = context.decoder_map[InkMLParser.DEVICE_CONFIGURATION_FOUND]
+        conversion_key: Tuple[int, float, bool] = (samples.shape[1], default_value_resolution,
+                                                   device_configuration_found)
+        conversions: dict = ctx.setdefault(COLUMN_CONVERSIONS, {})
+        conversion: Optional[tuple] = conversions.get(conversion_key)
+        if conversion is None:
+            conversion = InkMLParser.__column_conversion__(channels_by_type, *conversion_key)
+            conversions[conversion_key] = conversion
+        integer_columns, scaled_columns, resolutions, scalars, zero_columns = conversion
+        # Integer channels are truncated
+        for i in integer_columns:
+            samples[:, i] = samples[:, i].astype(np.int64)
+        # Convert to SI unit by dividing by resolution value, then to the SI unit of the channel
+        samples[:, scaled_columns] = scalars * (samples[:, scaled_columns] / resolutions)
+        # Boolean channels
+        samples[:, zero_columns] = 0.
         # Delta encoded data
         # From specification:
         # Regular channels may be reported as explicit values, differences, or second differences: Prefix symbols are
@@ -729,114 +819,41 @@ class InkMLParser(Parser):
         # a single quote (') indicates a single difference, and a double quote prefix (") indicates a second difference.
         # If there is no prefix, then the channel value is interpreted as explicit, difference, or second difference
         # based on the last prefix for the channel. If there is no last prefix, the value is interpreted as explicit.
-        for segment in points_data:
-            channels_values: list = []
-            modifier: str = InkMLParser.EMPTY_MODIFIER
-            # Find all matches in the current segment
-            matches = regex.findall(segment)
-            # only the first match contains the modifier
-            for point in matches:
-                if point.find(InkMLParser.EXPLICIT_VALUE_MODIFIER) == 0:
-                    modifier = InkMLParser.EXPLICIT_VALUE_MODIFIER
-                    break
-                elif point.find(InkMLParser.SINGLE_DIFFERENCE_MODIFIER) == 0:
-                    modifier = InkMLParser.SINGLE_DIFFERENCE_MODIFIER
-                    break
-                elif point.find(InkMLParser.SECOND_DIFFERENCE_MODIFIER) == 0:
-                    modifier = InkMLParser.SECOND_DIFFERENCE_MODIFIER
-                    break
-                else:
-                    modifier = last_modifier
-            channels_values = [InkMLParser.__remove_modifier__(v) for v in matches]
-            values: List[float] = []
-            # Iterate over channel values
-            for i, channel_value_str in enumerate(channels_values):
-                if i in ctx[CHANNELS]:
-                    sensor_channel: Dict[str, Any] = ctx[CHANNELS][i]
-                    if context.decoder_map[InkMLParser.DEVICE_CONFIGURATION_FOUND]:
-                        # In InkML the resolution is the conversion factor to unit that is defined in
-                        # device configuration
-                        # For instance, if the unit is mm for the channel is defined and a resolution of 100 is defined:
-                        # <inkml:channelProperty channel = "X" name = "resolution" value = "100" units = "1/mm" />
-                        # then the value is converted to mm by dividing by 100
-                        if RESOLUTION in sensor_channel:
-                            resolution = sensor_channel[RESOLUTION]
-                        else:
-                            # If the device configuration is not found, then the default resolution is used
-                            resolution = default_value_resolution
-                    else:
-                        # If the device configuration is not found, then the default resolution is used
-                        resolution = default_value_resolution
-                    channel_value = InkMLParser.__cast__(sensor_channel[InkMLParser.DATA_TYPE],
-                                                         InkMLParser.__remove_modifier__(channel_value_str))
-                    # Convert to SI unit by dividing by resolution value
-                    # The resolution value is the conversion factor to the SI unit
-                    channel_value /= resolution   # Normalize to unit of the channel
-                    # Now, convert to the unit defined in the channel to SI unit
-                    channel_value = device.unit2unit(sensor_channel[UNIT], device.si_unit(sensor_channel[UNIT]),
-                                                     channel_value)
-                    # Single difference modifier is the difference between the current and the last value
-                    if modifier == InkMLParser.SINGLE_DIFFERENCE_MODIFIER:
-                        value = last_values[i] + channel_value
-                        last_differences[i] += channel_value
-                    # Second difference modifier is the difference between the current and the last difference
-                    elif modifier == InkMLParser.SECOND_DIFFERENCE_MODIFIER:
-                        value = last_values[i] + (last_differences[i] + channel_value)
-                        last_differences[i] += channel_value
-                    else:
-                        value = channel_value
-                        last_differences = difference_vector[:]
-
-                    last_modifier = modifier
-                    values.append(value)
-                else:
-                    values.append(0)
-
-            last_values = values
-            # Concatenate x and y values
-            xs.append(values[x_index])
-            ys.append(values[y_index])
-            if channel_z:
-                zs.append(values[z_index])
-            # Based on the specification of UIM the values are in SI unit in memory and are serialized original unit
-            # The splines coordinates are in DIP unit
-            spline_x.append(device.unit2unit(device.Unit.M, device.Unit.DIP, values[x_index]))
-            spline_y.append(device.unit2unit(device.Unit.M, device.Unit.DIP, values[y_index]))
-
-            # Optional channels which are not provided in all cases
-            if channel_force:
-                value = values[f_index]
-                fs.append(value)
-            if channel_azimuth:
-                azimuth.append(values[azimuth_index])
-            if channel_altitude:
-                altitude.append(values[altitude_index])
-
-            if channel_timestamp:
-                if context.decoder_map[InkMLParser.ARTIFICIAL_TS_TAG] or t_index >= len(values):
-                    ts.append(int(time_offset + point_index * InkMLParser.DEFAULT_TIME_STEP * 1000))
-                else:
-                    try:
-                        ts.append(reference_timestamp + time_offset + values[t_index])
-                    except Exception as e:
-                        logger.error(f'Error in parsing timestamp: {e}')
-                point_index += 1
-
-        # Length of spline must be at least 4
-        if len(spline_x) == 1:
-            spline_x.append(spline_x[0] + 1.)
-            spline_y.append(spline_y[0] + 1.)
-        # Update bounding box
-        context.decoder_map[InkMLParser.MAX_X_TAG] = max(context.decoder_map[InkMLParser.MAX_X_TAG], max(spline_x))
-        context.decoder_map[InkMLParser.MAX_Y_TAG] = max(context.decoder_map[InkMLParser.MAX_Y_TAG], max(spline_y))
-        context.decoder_map[InkMLParser.MIN_X_TAG] = min(context.decoder_map[InkMLParser.MIN_X_TAG], min(spline_x))
-        context.decoder_map[InkMLParser.MIN_Y_TAG] = min(context.decoder_map[InkMLParser.MIN_Y_TAG], min(spline_y))
-        # Add extract control point in the beginning
-        spline_x.insert(0, spline_x[0])
-        spline_y.insert(0, spline_y[0])
-        # and at the end
-        spline_x.append(spline_x[-1])
-        spline_y.append(spline_y[-1])
+        if modifiers_found:
+            # Prefix of the first value of each sample
+            first_positions: np.ndarray = value_positions[row_start]
+            codes: np.ndarray = np.where(first_positions > 0, token_codes[first_positions - 1], -1).astype(np.int8)
+            samples = InkMLParser.__decode_differences__(tr_id, samples, codes)
+        # Concatenate x and y values
+        xs: np.ndarray = samples[:, x_index]
+        ys: np.ndarray = samples[:, y_index]
+        # Length of spline must be at least 4, the splines are allocated once including the extra control points in
+        # the beginning and at the end
+        splines: np.ndarray = np.empty((2, max(num_points, 2) + 2), dtype=np.float64)
+        coordinates: np.ndarray = splines[:, 1:-1]
+        # Based on the specification of UIM the values are in SI unit in memory and are serialized original unit
+        # The splines coordinates are in DIP unit, they are scaled directly into the buffer
+        np.multiply(xs, InkMLParser.M_TO_DIP, out=coordinates[0, :num_points])
+        np.multiply(ys, InkMLParser.M_TO_DIP, out=coordinates[1, :num_points])
+        spline_precision: Optional[int] = context.decoder_map.get(InkMLParser.SPLINE_PRECISION_TAG)
+        if spline_precision is not None:
+            # Quantize to the grid of the precision scheme
+            factor: float = 10. ** spline_precision
+            quantized: np.ndarray = coordinates[:, :num_points]
+            quantized *= factor
+            np.rint(quantized, out=quantized)
+            quantized /= factor
+        if num_points == 1:
+            coordinates[:, 1] = coordinates[:, 0] + 1.
+        splines[:, 0] = splines[:, 1]
+        splines[:, -1] = splines[:, -2]
+        # Update bounding box, the extrema are kept with the spline buffer for the bounding box of the strokes
+        extrema: np.ndarray = np.stack((coordinates.min(axis=1), coordinates.max(axis=1)), axis=1)
+        (min_x, max_x), (min_y, max_y) = extrema.tolist()
+        context.decoder_map[InkMLParser.MAX_X_TAG] = max(context.decoder_map[InkMLParser.MAX_X_TAG], max_x)
+        context.decoder_map[InkMLParser.MAX_Y_TAG] = max(context.decoder_map[InkMLParser.MAX_Y_TAG], max_y)
+        context.decoder_map[InkMLParser.MIN_X_TAG] = min(context.decoder_map[InkMLParser.MIN_X_TAG], min_x)
+        context.decoder_map[InkMLParser.MIN_Y_TAG] = min(context.decoder_map[InkMLParser.MIN_Y_TAG], min_y)
         # Adding sensor data
         if hover:
             sensor_data: sensor.SensorData = sensor.SensorData(input_context_id=ctx[INPUT_CONTEXT_ID],
@@ -846,30 +863,227 @@ class InkMLParser(Parser):
                                                                state=sensor.InkState.PLANE)
 
         stroke_data: Stroke = Stroke(sensor_data_id=sensor_data.id, style=InkMLParser.style())
-        # Spline data
-        stroke_data.splines_x = spline_x
-        stroke_data.splines_y = spline_y
+        # Spline data, the coordinates are assigned from the buffer when collecting the ink
         stroke_data.end_parameter = 1.
-        stroke_data.sizes = [1.] * len(spline_x)
-        stroke_data.offset_x = [1.] * len(spline_x)
-        stroke_data.offset_y = [1.] * len(spline_x)
+        stroke_data.sizes = [1.] * splines.shape[1]
+        if spline_precision is not None:
+            stroke_data.precision_scheme = PrecisionScheme(spline_precision << PrecisionScheme.POSITION_SHIFT_BITS)
         # Adding sensor data channels
-        sensor_data.add_data(channel_x[CHANNEL_REF], xs)
-        sensor_data.add_data(channel_y[CHANNEL_REF], ys)
+        sensor_data.add_data(channel_x[CHANNEL_REF], xs.tolist())
+        sensor_data.add_data(channel_y[CHANNEL_REF], ys.tolist())
         if channel_timestamp:
-            sensor_data.add_timestamp_data(channel_timestamp[CHANNEL_REF], ts)
+            if context.decoder_map[InkMLParser.ARTIFICIAL_TS_TAG] or t_index >= samples.shape[1]:
+                ts: np.ndarray = InkMLParser.__artificial_timestamps__(time_offset, num_points)
+            else:
+                # The timestamp column is not used afterwards, so the offsets are added in place
+                ts: np.ndarray = np.add(reference_timestamp + time_offset, samples[:, t_index],
+                                        out=samples[:, t_index])
+                if lengths is not None:
+                    ts = np.where(lengths > t_index, ts, InkMLParser.__artificial_timestamps__(time_offset, num_points))
+            sensor_data.add_timestamp_data(channel_timestamp[CHANNEL_REF], ts.tolist())
         if channel_z:
-            sensor_data.add_data(channel_z[CHANNEL_REF], zs)
+            sensor_data.add_data(channel_z[CHANNEL_REF], samples[:, z_index].tolist())
+        # Optional channels which are not provided in all cases
         if channel_force:
-            sensor_data.add_data(channel_force[CHANNEL_REF], fs)
+            sensor_data.add_data(channel_force[CHANNEL_REF], samples[:, f_index].tolist())
         if channel_azimuth:
-            sensor_data.add_data(channel_azimuth[CHANNEL_REF], azimuth)
+            sensor_data.add_data(channel_azimuth[CHANNEL_REF], samples[:, azimuth_index].tolist())
         if channel_altitude:
-            sensor_data.add_data(channel_altitude[CHANNEL_REF], altitude)
+            sensor_data.add_data(channel_altitude[CHANNEL_REF], samples[:, altitude_index].tolist())
         # Adding sensor data
         context.ink_model.sensor_data.add(sensor_data)
         if not hover:
             context.register_stroke(stroke_data, tr_id)
+            context.decoder_map[InkMLParser.STROKE_SPLINES_TAG].append((splines, extrema))
+
+    @staticmethod
+    def __artificial_timestamps__(time_offset: int, num_points: int) -> np.ndarray:
+        """
+        Artificial timestamps generated with the default sampling rate.
+
+        Parameters
+        ----------
+        time_offset: int
+            Time offset
+        num_points: int
+            Number of samples
+
+        Returns
+        -------
+        np.ndarray
+            Timestamps of the samples
+        """
+        return (time_offset + np.arange(1, num_points + 1) * InkMLParser.DEFAULT_TIME_STEP * 1000).astype(np.int64)
+
+    @staticmethod
+    def __column_conversion__(channels_by_type: Dict[device.InkSensorType, Dict[str, Any]], num_columns: int,
+                              default_value_resolution: float, device_configuration_found: bool) \
+            -> Tuple[List[int], np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Prepare the conversion of the sample columns of a context.
+        Only the columns of channels that are added to the sensor data are converted, the other columns are never read.
+
+        Parameters
+        ----------
+        channels_by_type: Dict[InkSensorType, Dict[str, Any]]
+            Channels of the context by channel type
+        num_columns: int
+            Number of columns of the samples
+        default_value_resolution: float
+            Default value resolution
+        device_configuration_found: bool
+            Flag if the device configuration is found
+
+        Returns
+        -------
+        Tuple[List[int], np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+            Integer columns, scaled columns with their resolutions and unit conversion scalars, and the columns which
+            are set to zero
+        """
+        numpy_data_types: Dict[device.DataType, type] = InkMLParser.NUMPY_DATA_TYPES
+        si_unit_scales: Dict[device.Unit, float] = InkMLParser.SI_UNIT_SCALES
+        integer_columns: List[int] = []
+        scaled_columns: List[int] = []
+        resolutions: List[float] = []
+        scalars: List[float] = []
+        zero_columns: List[int] = []
+        for sensor_type in InkMLParser.SAMPLE_CHANNEL_TYPES:
+            sensor_channel: Optional[Dict[str, Any]] = channels_by_type.get(sensor_type)
+            if sensor_channel is None or sensor_channel[INDEX] >= num_columns:
+                continue
+            i: int = sensor_channel[INDEX]
+            # Numeric values are never the boolean true value
+            if sensor_channel[InkMLParser.DATA_TYPE] == device.DataType.BOOLEAN:
+                zero_columns.append(i)
+                continue
+            if np.issubdtype(numpy_data_types[sensor_channel[InkMLParser.DATA_TYPE]], np.integer):
+                integer_columns.append(i)
+            # In InkML the resolution is the conversion factor to unit that is defined in device configuration
+            # For instance, if the unit is mm for the channel is defined and a resolution of 100 is defined:
+            # <inkml:channelProperty channel = "X" name = "resolution" value = "100" units = "1/mm" />
+            # then the value is converted to mm by dividing by 100
+            # If the device configuration is not found, then the default resolution is used
+            if device_configuration_found and RESOLUTION in sensor_channel:
+                resolutions.append(sensor_channel[RESOLUTION])
+            else:
+                resolutions.append(default_value_resolution)
+            scaled_columns.append(i)
+            scalars.append(si_unit_scales[sensor_channel[UNIT]])
+        return (integer_columns, np.array(scaled_columns, dtype=np.intp), np.array(resolutions, dtype=np.float64),
+                np.array(scalars, dtype=np.float64), np.array(zero_columns, dtype=np.intp))
+
+    @staticmethod
+    def __plain_values__(trace_data: bytes) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Convert a trace which only contains explicit decimal values without modifiers.
+
+        Parameters
+        ----------
+        trace_data: bytes
+            UTF-8 encoded trace data
+
+        Returns
+        -------
+        Optional[Tuple[np.ndarray, np.ndarray]]
+            Values of the trace and the sample index of each value, None if the trace needs to be tokenized
+        """
+        if trace_data.translate(None, InkMLParser.PLAIN_TRACE_CHARS):
+            return None
+        chars: np.ndarray = np.frombuffer(trace_data, dtype=np.uint8)
+        # A value starts with the first character after a separator or whitespace
+        in_value: np.ndarray = ~InkMLParser.VALUE_DELIMITERS[chars]
+        value_starts: np.ndarray = in_value.copy()
+        value_starts[1:] &= ~in_value[:-1]
+        value_rows: np.ndarray = np.cumsum(chars == InkMLParser.SEPARATION_CODE)[value_starts]
+        try:
+            # NumPy 1.x only warns about unmatched data and returns the values read so far
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                values: np.ndarray = np.fromstring(trace_data.replace(b',', b' '), dtype=np.float64, sep=' ')
+        except (ValueError, Warning):
+            return None
+        # Malformed values, e.g., 1-2, are left to the tokenizer
+        if values.size != value_rows.size:
+            return None
+        return values, value_rows
+
+    @staticmethod
+    def __trace_data__(trace: Element) -> Union[str, bytes]:
+        """
+        Trace data of a trace element.
+
+        Parameters
+        ----------
+        trace: Element
+            Trace element
+
+        Returns
+        -------
+        Union[str, bytes]
+            Trace data, UTF-8 encoded if the trace has no child elements
+        """
+        if len(trace) == 0:
+            # Serialized directly by lxml, the text is not decoded to a string
+            return etree.tostring(trace, method='text', encoding='utf-8', with_tail=False)
+        # There might be annotation within the trace, then tr.text is missing content
+        return ''.join([trace.text or '', *(t.tail or '' for t in trace)])
+
+    @staticmethod
+    def __decode_differences__(tr_id: str, samples: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """Decode samples that are reported as single or second differences.
+
+        The modifier of a sample is the prefix of its first value. Samples without prefix keep the modifier of the
+        previous sample, the first sample is explicit by default. Consecutive samples with the same modifier are
+        decoded at once, so there is no Python loop per sample.
+
+        Parameters
+        ----------
+        tr_id: str
+            Trace id
+        samples: np.ndarray
+            Samples of the trace converted to SI unit, one row per sample
+        codes: np.ndarray
+            Modifier of each sample as index into MODIFIERS, -1 if the first value of the sample has no prefix
+
+        Returns
+        -------
+        np.ndarray
+            Explicit values of the samples, the samples are decoded in place
+
+        Raises
+        ------
+        InkMLParserException
+            If the trace starts with a difference.
+        """
+        num_samples: int = codes.size
+        # Samples without prefix keep the last modifier, the first sample is explicit by default
+        prefixed: np.ndarray = codes >= 0
+        prefixed[0] = True
+        codes = np.maximum(codes, 0)[np.maximum.accumulate(np.where(prefixed, np.arange(num_samples), 0))]
+        # Runs of samples sharing the same modifier, as index into MODIFIERS
+        starts: np.ndarray = np.flatnonzero(np.diff(codes, prepend=-1))
+        ends: np.ndarray = np.append(starts[1:], num_samples)
+        explicit: int = InkMLParser.MODIFIERS.index(InkMLParser.EXPLICIT_VALUE_MODIFIER)
+        second_difference: int = InkMLParser.MODIFIERS.index(InkMLParser.SECOND_DIFFERENCE_MODIFIER)
+        differences: np.ndarray = np.zeros(samples.shape[1], dtype=np.float64)
+        # The samples are decoded in place, the accumulation runs in the same order as decoding sample by sample
+        for start, end, code in zip(starts.tolist(), ends.tolist(), codes[starts].tolist()):
+            if code == explicit:
+                differences = np.zeros(samples.shape[1], dtype=np.float64)
+                continue
+            if start == 0:
+                raise InkMLParserException(f'Trace:={tr_id} starts with a difference instead of an explicit value.')
+            block: np.ndarray = samples[start:end]
+            # Accumulated differences, continuing from the previous state
+            accumulated: np.ndarray = block.copy()
+            accumulated[0] += differences
+            np.add.accumulate(accumulated, axis=0, out=accumulated)
+            differences = accumulated[-1]
+            if code == second_difference:
+                block[:] = accumulated
+            block[0] += samples[start - 1]
+            np.add.accumulate(block, axis=0, out=block)
+        return samples
 
     @classmethod
     def __trace_view__(cls, context: DecoderContext, trace_view: Element, namespace: str):
@@ -887,7 +1101,7 @@ class InkMLParser(Parser):
         """
         path_ids: List[str] = []
         annotations: list = []
-        for tv in trace_view.findall(f'./{namespace}traceView'):
+        for tv in trace_view.iterchildren(f'{namespace}traceView'):
             if TRACE_DATA_REF in tv.attrib:
                 trace_id_ref: str = tv.attrib[TRACE_DATA_REF]
                 ref: str = reference_id(trace_id_ref)
@@ -896,7 +1110,7 @@ class InkMLParser(Parser):
                         raise InkMLParserException('Element already exists.')
                     path_ids.append(ref)
 
-        for a in trace_view.findall(f'./{namespace}annotation'):
+        for a in trace_view.iterchildren(f'{namespace}annotation'):
             a_type: str = a.attrib[ANNOTATION_TYPE]
             a_value: str = a.text.strip()
             annotations.append({ANNOTATION_TYPE: a_type, ANNOTATION_VALUE: a_value})
@@ -932,54 +1146,78 @@ class InkMLParser(Parser):
         default_value_resolution: float (optional) [default: 1.]
             Default value resolution
         """
-        trace_ids: List[str] = []
-        path_ids: List[str] = []
-        # Check if context is set
-        if CONTEXT_REF in trace_group.attrib:
-            context.decoder_map[InkMLParser.CURRENT_CONTEXT_TAG] = trace_group.attrib[CONTEXT_REF]
+        trace_view_tag: str = f'{namespace}traceView'
+        trace_tag: str = f'{namespace}trace'
+        annotation_tag: str = f'{namespace}annotation'
+        trace_group_tag: str = f'{namespace}traceGroup'
+        # Depth-first walk over the nested trace groups, in document order
+        stack: deque = deque([(trace_group, parent_id, depth, tg_counter)])
+        while stack:
+            node, node_parent_id, node_depth, node_index = stack.pop()
+            trace_ids: List[str] = []
+            path_ids: List[str] = []
+            # Check if context is set
+            if CONTEXT_REF in node.attrib:
+                context.decoder_map[InkMLParser.CURRENT_CONTEXT_TAG] = node.attrib[CONTEXT_REF]
+
+            tg_id: str = xml_id(node)
+            # Classify the children in a single pass
+            trace_views: List[Element] = []
+            traces: List[Element] = []
+            annotation_elements: List[Element] = []
+            sub_groups: List[Element] = []
+            for child in node:
+                tag = child.tag
+                if tag == trace_tag:
+                    traces.append(child)
+                elif tag == trace_view_tag:
+                    trace_views.append(child)
+                elif tag == annotation_tag:
+                    annotation_elements.append(child)
+                elif tag == trace_group_tag:
+                    sub_groups.append(child)
+
+            for tv in trace_views:
+                if TRACE_DATA_REF in tv.attrib:
+                    ref: str = tv.attrib[TRACE_DATA_REF]
 
-        tg_id: str = xml_id(trace_group)
-        for tv in trace_group.findall(f'./{namespace}traceView'):
-            if TRACE_DATA_REF in tv.attrib:
-                ref: str = tv.attrib[TRACE_DATA_REF]
-
-                if ref in path_ids:
-                    raise Exception('Element already exists.')
+                    if ref in path_ids:
+                        raise Exception('Element already exists.')
 
-                path_ids.append(reference_id(ref))
+                    path_ids.append(reference_id(ref))
 
-        # Iterate over traces
-        for tr in trace_group.findall(f'./{namespace}trace'):
-            tr_id: str = xml_id(tr)
+            # Iterate over traces
+            for tr in traces:
+                tr_id: str = xml_id(tr)
 
-            if tr_id in trace_ids:
-                raise Exception('Element already exists.')
+                if tr_id in trace_ids:
+                    raise Exception('Element already exists.')
 
-            trace_ids.append(tr_id)
+                trace_ids.append(tr_id)
 
-            ctx_id: str = tr.attrib[CONTEXT_REF] if CONTEXT_REF in tr.attrib \
-                else context.decoder_map[InkMLParser.CURRENT_CONTEXT_TAG]
-            InkMLParser.__parse_samples__(context, tr_id, ctx_id, tr.text,
-                                          default_value_resolution=default_value_resolution)
-            trace_counter += 1
+                ctx_id: str = tr.attrib[CONTEXT_REF] if CONTEXT_REF in tr.attrib \
+                    else context.decoder_map[InkMLParser.CURRENT_CONTEXT_TAG]
+                InkMLParser.__parse_samples__(context, tr_id, ctx_id, tr.text,
+                                              default_value_resolution=default_value_resolution)
 
-        annotations: list = []
-        # Iterate over annotations
-        for a in trace_group.findall(f'./{namespace}annotation'):
-            a_type: str = a.attrib[ANNOTATION_TYPE]
-            a_value: str = a.text.strip()
-            annotations.append({ANNOTATION_TYPE: a_type, ANNOTATION_VALUE: a_value})
+            annotations: list = []
+            # Iterate over annotations
+            for a in annotation_elements:
+                a_type: str = a.attrib[ANNOTATION_TYPE]
+                a_value: str = a.text.strip()
+                annotations.append({ANNOTATION_TYPE: a_type, ANNOTATION_VALUE: a_value})
 
-        context.decoder_map[SEMANTICS].append(
-            {
-                IDENTIFIER: tg_id, PARENT: parent_id, SEMANTICS: annotations, STROKE_IDS: trace_ids, DEPTH: depth,
-                INDEX: tg_counter
-            }
-        )
-        # Iterate over sub-nodes
-        for tg in trace_group.findall(f'./{namespace}traceGroup'):
-            trace_counter = InkMLParser.__trace_group__(context, tg, trace_counter, tg_counter, tg_id, depth=depth + 1)
-            tg_counter += 1
+            context.decoder_map[SEMANTICS].append(
+                {
+                    IDENTIFIER: tg_id, PARENT: node_parent_id, SEMANTICS: annotations, STROKE_IDS: trace_ids,
+                    DEPTH: node_depth, INDEX: node_index
+                }
+            )
+            # Sub-nodes are indexed from the index of their parent, pushed in reverse to pop them in document order
+            for offset in range(len(sub_groups) - 1, -1, -1):
+                stack.append((sub_groups[offset], tg_id, node_depth + 1, node_index + offset))
+            if node is trace_group:
+                tg_counter += len(sub_groups)
         return tg_counter
 
     @classmethod
@@ -1044,7 +1282,7 @@ class InkMLParser(Parser):
         namespace: str
             Namespace used by parser
         """
-        for c in root.findall(f'.//{namespace}context'):
+        for c in root.iter(f'{namespace}context'):
             ctx_id: str = xml_id(c)
             # Set current context
             context.decoder_map[InkMLParser.CURRENT_CONTEXT_TAG] = ctx_id
@@ -1055,7 +1293,7 @@ class InkMLParser(Parser):
                 ts_id: str = xml_id(context_timestamp)
 
                 if TIME_STRING in context_timestamp.attrib:
-                    ts: datetime = dateutil.parser.parse(context_timestamp.attrib[TIME_STRING])
+                    ts: datetime.datetime = parse_time_string(context_timestamp.attrib[TIME_STRING])
                     if InkMLParser.REFERENCE_TIMESTAMP not in context.decoder_map[InkMLParser.CONTEXT_TAG][ctx_id]:
                         context.decoder_map[InkMLParser.CONTEXT_TAG][ctx_id][InkMLParser.REFERENCE_TIMESTAMP] = {}
                     context.decoder_map[InkMLParser.CONTEXT_TAG][ctx_id][InkMLParser.REFERENCE_TIMESTAMP][ts_id] \
@@ -1066,7 +1304,7 @@ class InkMLParser(Parser):
                 context.decoder_map[InkMLParser.DEVICE_CONFIGURATION_FOUND] = True
                 InkMLParser.__handle_ink_source__(context, ink_source, ctx_id)
         # Handle the devices
-        for ink_source in root.findall(f'.//{namespace}inkSource'):
+        for ink_source in root.iter(f'{namespace}inkSource'):
             context.decoder_map['device_configuration_found'] = True
             InkMLParser.__handle_ink_source__(context, ink_source,
                                               context.decoder_map[InkMLParser.CURRENT_CONTEXT_TAG])
@@ -1083,9 +1321,9 @@ class InkMLParser(Parser):
                                              trace_format, namespace)
 
     @classmethod
-    def __collect_ink__(cls, context: DecoderContext, inkml_obj: Element, namespace: str, brush: Brush,
-                        cropping: bool = False, cropping_offset: int = 0, default_value_resolution: float = 1.,
-                        type_def_pred: str = semantics.IS):
+    def __collect_ink__(cls, context: DecoderContext, inkml_obj: Element, traces: Iterable[Element], namespace: str,
+                        brush: Brush, cropping: bool = False, cropping_offset: int = 0,
+                        default_value_resolution: float = 1., type_def_pred: str = semantics.IS):
         """Collect input data from InkML object.
         Parameters
         ----------
@@ -1093,6 +1331,8 @@ class InkMLParser(Parser):
             Decoder context containing the current parsing state.
         inkml_obj: Element
             InkML object
+        traces: Iterable[Element]
+            Top-level traces of the InkML object
         namespace: str
             Namespace used by parser
         brush: Brush
@@ -1105,49 +1345,41 @@ class InkMLParser(Parser):
             The default value resolution
         """
         start: float = time.time()
-        traces: int = 0
+        num_traces: int = 0
+        # The flags do not change while the traces are collected
+        decoder_map: Dict[str, Any] = context.decoder_map
+        artificial_ts: bool = decoder_map.get(InkMLParser.ARTIFICIAL_TS_TAG, False)
+        parse_samples = InkMLParser.__parse_samples__
         # --------------------------------------------------------------------------------------------------------------
-        for tr in inkml_obj.findall(f'./{namespace}trace'):
+        for tr in traces:
+            attrib = tr.attrib
             tr_id: str = xml_id(tr)
             time_offset: int = 0
-            context_id: str = context.decoder_map[InkMLParser.CURRENT_CONTEXT_TAG]
-            event_type: str = PEN_DOWN
-            if TYPE in tr.attrib:
-                event_type = tr.attrib[TYPE]
-            if TIME_OFFSET in tr.attrib:
-                time_offset = int(tr.attrib[TIME_OFFSET])
-            if InkMLParser.ARTIFICIAL_TS_TAG in context.decoder_map \
-                    and context.decoder_map[InkMLParser.ARTIFICIAL_TS_TAG]:
-                time_offset: int = int(start + traces * 2)
-            if CONTEXT_REF in tr.attrib:
-                context_id = tr.attrib[CONTEXT_REF]
+            context_id: str = decoder_map[InkMLParser.CURRENT_CONTEXT_TAG]
+            event_type: str = attrib.get(TYPE, PEN_DOWN)
+            if TIME_OFFSET in attrib:
+                time_offset = int(attrib[TIME_OFFSET])
+            if artificial_ts:
+                time_offset: int = int(start + num_traces * 2)
+            if CONTEXT_REF in attrib:
+                context_id = attrib[CONTEXT_REF]
             try:
                 if event_type == PEN_DOWN:
-                    # There might be annotation within the trace, then tr.text is missing content
-                    text: str = tr.text
-                    for t in tr:
-                        text += t.tail
-                    text = text.strip()
-                    InkMLParser.__parse_samples__(context, tr_id, context_id, text, time_offset,
-                                                  default_value_resolution)
-                    traces += 1
+                    text: Union[str, bytes] = InkMLParser.__trace_data__(tr)
+                    parse_samples(context, tr_id, context_id, text, time_offset, default_value_resolution)
+                    num_traces += 1
                 elif event_type == PEN_UP:
-                    # There might be annotation within the trace, then tr.text is missing content
-                    text: str = tr.text
-                    for t in tr:
-                        text += t.tail
-                    text = text.strip()
-                    InkMLParser.__parse_samples__(context, tr_id, context_id, text, time_offset,
-                                                  default_value_resolution, hover=True)
-                    traces += 1
+                    text: Union[str, bytes] = InkMLParser.__trace_data__(tr)
+                    parse_samples(context, tr_id, context_id, text, time_offset, default_value_resolution, hover=True)
+                    num_traces += 1
 
             except InkMLParserException as e:
                 logger.warning(e)
         # Collect hierarchical tree for trace groups
-        for tg in inkml_obj.findall(f'./{namespace}traceGroup'):
+        for tg in inkml_obj.iterchildren(f'{namespace}traceGroup'):
             InkMLParser.__trace_group__(context, tg, depth=0)
         # Trace view as alternative for ground truth
-        for tv in inkml_obj.findall(f'./{namespace}traceView'):
+        for tv in inkml_obj.iterchildren(f'{namespace}traceView'):
             InkMLParser.__trace_view__(context, tv, namespace=namespace)
 
         context.ink_model.brushes.add_vector_brush(brush)
@@ -1161,19 +1393,29 @@ class InkMLParser(Parser):
         y_min: float = sys.float_info.max
         x_max: float = 0.
         y_max: float = 0.
-        # Crop ink if configured
-        if cropping:
-            for p in context.strokes:
-                p.splines_x = [s - context.decoder_map[InkMLParser.MIN_X_TAG] + cropping_offset for s in p.splines_x]
-                p.splines_y = [s - context.decoder_map[InkMLParser.MIN_Y_TAG] + cropping_offset for s in p.splines_y]
-
+        # Minimum of x and y, subtracted from the spline coordinates when cropping
+        crop_min: np.ndarray = np.array([[decoder_map[InkMLParser.MIN_X_TAG]], [decoder_map[InkMLParser.MIN_Y_TAG]]],
+                                        dtype=np.float64)
+        stroke_splines: List[Tuple[np.ndarray, np.ndarray]] = decoder_map[InkMLParser.STROKE_SPLINES_TAG]
         # Add the children of root node
-        for stroke in context.strokes:
-            x_min = min(stroke.spline_min_x, x_min)
-            x_max = max(stroke.spline_max_x, x_max)
-            y_min = min(stroke.spline_min_y, y_min)
-            y_max = max(stroke.spline_max_y, y_max)
+        for stroke, (splines, _) in zip(context.strokes, stroke_splines):
+            # Crop ink if configured, both coordinates are shifted in place
+            if cropping:
+                splines -= crop_min
+                splines += cropping_offset
+            stroke.splines_x, stroke.splines_y = splines.tolist()
             root.add(StrokeNode(stroke))
+        if stroke_splines:
+            # Extrema of all strokes, [stroke, axis, (min, max)]
+            extrema: np.ndarray = np.stack([e for _, e in stroke_splines])
+            # The shift is monotonic, so the extrema are shifted the same way instead of searching them again
+            if cropping:
+                extrema -= crop_min
+                extrema += cropping_offset
+            x_min = min(float(extrema[:, 0, 0].min()), x_min)
+            x_max = max(float(extrema[:, 0, 1].max()), x_max)
+            y_min = min(float(extrema[:, 1, 0].min()), y_min)
+            y_max = max(float(extrema[:, 1, 1].max()), y_max)
         # Set the bounding box
         context.ink_model.ink_tree.root.group_bounding_box = BoundingBox(x=x_min, y=y_min, width=x_max - x_min,
                                                                          height=y_max - y_min)
@@ -1193,19 +1435,22 @@ class InkMLParser(Parser):
         namespace: str (optional) [default: '{http://www.w3.org/2003/InkML}']
             Namespace used by parser
         """
-        for a in inkml_obj.findall(f'./{namespace}annotation'):
+        for a in inkml_obj.iterchildren(f'{namespace}annotation'):
             if 'type' in a.attrib:
                 context.ink_model.add_property(a.attrib['type'], a.text)
             else:
                 logger.warning(a.attrib)
 
-    def __build_object__(self, inkml_obj: Element) -> uim.InkModel:
+    def __build_object__(self, inkml_obj: Element, traces: Optional[Iterator[Element]] = None) -> uim.InkModel:
         """Build input data document.
 
         Parameters
         ----------
         inkml_obj: Element
             InkML object
+        traces: Optional[Iterator[Element]] (optional) [default: None]
+            Top-level traces streamed from the document, see `__iter_traces__`. If not set, the traces
+            of the InkML object are used.
 
         Returns
         -------
@@ -1225,20 +1470,24 @@ class InkMLParser(Parser):
         context.decoder_map[InkMLParser.MAX_Y_TAG] = 0.
         context.decoder_map[InkMLParser.ARTIFICIAL_TS_TAG] = False
         context.decoder_map[InkMLParser.DEVICE_CONFIGURATION_FOUND] = False
+        context.decoder_map[InkMLParser.SPLINE_PRECISION_TAG] = self.spline_precision
+        context.decoder_map[InkMLParser.STROKE_SPLINES_TAG] = []
         context.decoder_map[SEMANTICS] = []
-        # Reset channel and context
-        InkMLParser.__collect_meta_data__(context, inkml_obj, namespace=self.default_namespace)
+        if traces is None:
+            traces = inkml_obj.iterchildren(f'{self.default_namespace}trace')
         # Collect data
         InkMLParser.__collect_channels__(context, inkml_obj, namespace=self.default_namespace,
                                          default_sample_rate=self.__default_sample_rate)
         # Build the device configuration from the collected data
         self.__build_device_configuration__(context)
         # Collect the ink strokes
-        InkMLParser.__collect_ink__(context, inkml_obj, namespace=self.default_namespace,
+        InkMLParser.__collect_ink__(context, inkml_obj, traces, namespace=self.default_namespace,
                                     brush=self.configured_brushes[self.use_brush],
                                     cropping=self.cropping_ink, cropping_offset=self.__cropping_offset,
                                     default_value_resolution=self.default_value_resolution,
                                     type_def_pred=self.__type_def_pred)
+        # Document based annotations, the document is complete once all traces are consumed
+        InkMLParser.__collect_meta_data__(context, inkml_obj, namespace=self.default_namespace)
         # Finally build views
         self.__build_views__(context, inkml_obj, namespace=self.default_namespace, view=self.content_view)
         return context.ink_model
@@ -1257,23 +1506,7 @@ class InkMLParser(Parser):
         list
             List of values
         """
-        return re.sub(' +', ' ', point.replace('\n', ' ').replace('\r', '')).split(' ')
-
-    @staticmethod
-    def __clean__(trace_data: str) -> str:
-        """
-        Clean the trace data.
-        Parameters
-        ----------
-        trace_data: str
-            Trace data
-
-        Returns
-        -------
-        str
-            Cleaned trace data
-        """
-        return re.sub(', ', ',', trace_data.replace('\n', ' ').replace('\r', '').strip())
+        return point.replace('\r', '').split()
 
     @staticmethod
     def default_brush() -> VectorBrush:
@@ -1383,6 +1616,8 @@ class InkMLParser(Parser):
             input_context = device.InputContext(environment_id=InkMLParser.default_environment().id,
                                                 sensor_context_id=sensor_ctx.id)
             context_map[INPUT_CONTEXT_ID] = input_context.id
+            # The channels of the context are complete, index them for the lookups per trace
+            context_map[CHANNELS_BY_TYPE] = InkMLParser.__channels_by_type__(context_map[CHANNELS])
             # Add ink device
             context.ink_model.input_configuration.add_ink_device(ink_device)
             # Adding the context
@@ -1391,19 +1626,24 @@ class InkMLParser(Parser):
             context.ink_model.input_configuration.add_input_context(input_context)
 
     @staticmethod
-    def __context_get__(channels: dict, channel_type: device.InkSensorType) -> Optional[Dict[str, Any]]:
+    def __channels_by_type__(channels: dict) -> Dict[device.InkSensorType, Dict[str, Any]]:
         """
-        Get context for channel type.
+        Index the channels of a context by channel type.
 
         Parameters
         ----------
         channels: dict
-            Channel dictionary if it exists, otherwise None
+            Channel dictionary of the context
+
+        Returns
+        -------
+        Dict[InkSensorType, Dict[str, Any]]
+            First channel for each channel type
         """
+        channels_by_type: Dict[device.InkSensorType, Dict[str, Any]] = {}
         for c in channels.values():
-            if c[CHANNEL_TYPE] == channel_type:
-                return c
-        return None
+            channels_by_type.setdefault(c[CHANNEL_TYPE], c)
+        return channels_by_type
 
     def parse(self, path_or_stream: Union[str, bytes, memoryview, BytesIO, pathlib.Path], *args, **kwargs) \
             -> uim.InkModel:
@@ -1419,25 +1659,91 @@ class InkMLParser(Parser):
             Additional keyword arguments
         """
         if isinstance(path_or_stream, (str, pathlib.Path)):
-            # It's a file path
-            with open(path_or_stream, 'r') as inkml_file:
-                buffer = inkml_file.read()
+            # It's a file path, the file is read incrementally
+            source: Union[str, BytesIO] = str(path_or_stream)
+        elif isinstance(path_or_stream, (bytes, memoryview)):
+            source: Union[str, BytesIO] = BytesIO(path_or_stream)
         else:
             # It's a buffer
-            if isinstance(path_or_stream, (bytes, memoryview)):
-                path_or_stream = BytesIO(path_or_stream)
-
             buffer = path_or_stream.read()
-        parser: etree.XMLParser = etree.XMLParser(recover=True)
-        if isinstance(buffer, str):
-            root: Element = etree.fromstring(buffer.encode(), parser)
-        else:
-            root: Element = etree.fromstring(buffer, parser)
-        # Set correct namespace
-        for s, ns in root.nsmap.items():
+            source: Union[str, BytesIO] = BytesIO(buffer.encode() if isinstance(buffer, str) else buffer)
+        # First pass, the document without its top-level traces, as contexts may be defined after the traces
+        events: Iterator[Tuple[str, Element]] = etree.iterparse(source, events=('start', 'end'), recover=True)
+        _, root = next(events, (None, None))
+        if root is None:
+            raise InkMLParserException('InkML document is empty.')
+        self.__detect_namespace__(root)
+        for _ in InkMLParser.__iter_traces__(root, events, self.default_namespace):
+            pass
+        # Second pass, stream the top-level traces
+        if isinstance(source, BytesIO):
+            source.seek(0)
+        trace_events: Iterator[Tuple[str, Element]] = etree.iterparse(source, events=('start', 'end'), recover=True)
+        _, trace_root = next(trace_events)
+        return self.__build_object__(root, InkMLParser.__iter_traces__(trace_root, trace_events,
+                                                                      self.default_namespace, keep_others=False))
+
+    def parse_element(self, inkml_obj: Element) -> uim.InkModel:
+        """Parsing an InkML element of an already parsed XML document, e.g., the ink of a container format.
+
+        Parameters
+        ----------
+        inkml_obj: Element
+            InkML ink element
+
+        Returns
+        -------
+        uim.InkModel
+            Universal Ink Model
+        """
+        self.__detect_namespace__(inkml_obj)
+        return self.__build_object__(inkml_obj)
+
+    def __detect_namespace__(self, inkml_obj: Element):
+        """Set the InkML namespace as default namespace if the element declares it.
+
+        Parameters
+        ----------
+        inkml_obj: Element
+            InkML ink element
+        """
+        for s, ns in inkml_obj.nsmap.items():
             if ns == 'http://www.w3.org/2003/InkML':
                 self.__default_namespace = '{http://www.w3.org/2003/InkML}'
-        return self.__build_object__(root)
+
+    @staticmethod
+    def __iter_traces__(root: Element, events: Iterator[Tuple[str, Element]], namespace: str,
+                        keep_others: bool = True) -> Iterator[Element]:
+        """Stream the top-level traces of an InkML document.
+
+        Each trace is yielded as soon as it is parsed completely and removed from the document once the consumer
+        continues, so only a single trace is kept in memory.
+
+        Parameters
+        ----------
+        root: Element
+            Root element of the document that is parsed
+        events: Iterator[Tuple[str, Element]]
+            Events of `etree.iterparse`, positioned after the start of the root element
+        namespace: str
+            Namespace used by parser
+        keep_others: bool (optional) [default: True]
+            Flag if the other top-level elements are kept in the document, otherwise they are removed as well
+
+        Yields
+        ------
+        Element
+            Top-level trace
+        """
+        trace_tag: str = f'{namespace}trace'
+        for event, element in events:
+            if event == 'end' and element.getparent() is root:
+                if element.tag == trace_tag:
+                    yield element
+                elif keep_others:
+                    continue
+                element.clear()
+                root.remove(element)
 
     @staticmethod
     def guess_parameters(path_or_stream: Union[str, bytes, memoryview, BytesIO, pathlib.Path]) \
@@ -1457,32 +1763,42 @@ class InkMLParser(Parser):
         contains_device_configuration: bool = False
         namespace: str = ''
         if isinstance(path_or_stream, (str, pathlib.Path)):
-            # It's a file path
-            with open(path_or_stream, 'r') as inkml_file:
-                buffer = inkml_file.read()
+            # It's a file path, the file is read incrementally
+            source: Union[str, BytesIO] = str(path_or_stream)
+        elif isinstance(path_or_stream, (bytes, memoryview)):
+            source: Union[str, BytesIO] = BytesIO(path_or_stream)
         else:
             # It's a buffer
-            if isinstance(path_or_stream, (bytes, memoryview)):
-                path_or_stream = BytesIO(path_or_stream)
-
             buffer = path_or_stream.read()
-        parser = etree.XMLParser(recover=True)
-        if isinstance(buffer, str):
-            root: Element = etree.fromstring(buffer.encode(), parser)
-        else:
-            root: Element = (etree.fromstring(buffer, parser))
+            source: Union[str, BytesIO] = BytesIO(buffer.encode() if isinstance(buffer, str) else buffer)
+        events: Iterator[Tuple[str, Element]] = etree.iterparse(source, events=('start', 'end'), recover=True)
+        _, root = next(events, (None, None))
+        if root is None:
+            raise InkMLParserException('InkML document is empty.')
         # Set correct namespace
         for _, ns in root.nsmap.items():
             if ns == 'http://www.w3.org/2003/InkML':
                 namespace = '{http://www.w3.org/2003/InkML}'
-        source: list = root.findall(f'.//{namespace}inkSource')
-        if len(source) > 0:
-            contains_device_configuration = True
-        xs: list = [float(coord[0].split(' ')[0]) for coord in
-                    [InkMLParser.__clean__(trace_tag.text).split(InkMLParser.SEPARATION_CHAR)
-                     for trace_tag in root.findall(f'.//{namespace}trace')]]
-        max_x: float = max(xs)
-        min_x: float = min(xs)
+        ink_source_tag: str = f'{namespace}inkSource'
+        trace_tag: str = f'{namespace}trace'
+        min_x: Optional[float] = None
+        max_x: Optional[float] = None
+        for event, element in events:
+            if event != 'end':
+                continue
+            if element.tag == ink_source_tag:
+                contains_device_configuration = True
+            elif element.tag == trace_tag:
+                # Only the first value of each trace is needed
+                x: float = float(element.text.split(InkMLParser.SEPARATION_CHAR, 1)[0].split(None, 1)[0])
+                min_x = x if min_x is None else min(min_x, x)
+                max_x = x if max_x is None else max(max_x, x)
+            # Elements which are parsed completely are not needed anymore
+            element.clear()
+            while element is not root and element.getprevious() is not None:
+                del element.getparent()[0]
+        if min_x is None:
+            raise InkMLParserException('InkML document contains no traces.')
         digits: int = int(math.log10(max_x - min_x)) + 1
         resolution: float = max(1., 10. ** (digits - 3))
         return contains_device_configuration, resolution, min_x, max_x
@@ -1505,10 +1821,11 @@ class InkMLParser(Parser):
             Namespace used by parser
         """
         idx: int = 0
-        for ch in trace_format.findall(f'./{namespace}channel'):
-            name: str = ch.attrib[NAME]
-            if name.lower() in InkMLParser.MAP_CHANNEL_TYPE:
-                sensor_type: device.InkSensorType = InkMLParser.MAP_CHANNEL_TYPE[name.lower()]
+        for ch in trace_format.iterchildren(f'{namespace}channel'):
+            # The name is interned, it is compared with the channel of every channel property
+            name: str = sys.intern(ch.attrib[NAME])
+            sensor_type: Optional[device.InkSensorType] = InkMLParser.MAP_CHANNEL_TYPE.get(name.lower())
+            if sensor_type is not None:
                 unit_type: Optional[device.Unit] = None
                 channel_resolution: float = 1.
                 precision: int = InkMLParser.DEFAULT_PRECISION[sensor_type]
@@ -1556,10 +1873,11 @@ class InkMLParser(Parser):
         namespace: str
             Namespace used by parser
         """
-        for ch in channel_properties.findall(f'./{namespace}channelProperty'):
-            channel: str = ch.attrib[CHANNEL]
+        for ch in channel_properties.iterchildren(f'{namespace}channelProperty'):
+            # Interned names compare by identity with the channel names and the property keys
+            channel: str = sys.intern(ch.attrib[CHANNEL])
             if NAME in ch.attrib:
-                name: str = ch.attrib[ANNOTATION_NAME]
+                name: str = sys.intern(ch.attrib[ANNOTATION_NAME])
                 value: str = ch.attrib[ANNOTATION_VALUE]
                 for c in context.decoder_map[InkMLParser.CONTEXT_TAG][ctx_id][CHANNELS].values():
                     if c[NAME] == channel:
@@ -1736,16 +2054,3 @@ class InkMLParser(Parser):
                     context.ink_model.add_semantic_triple(subject=stroke_group.uri,
                                                           predicate=self.__type_def_pred,
                                                           obj=self.default_annotation_type)
-
-    @classmethod
-    def __remove_modifier__(cls, channel_value_str):
-        """
-        Remove modifier from channel value.
-
-        Parameters
-        ----------
-        channel_value_str: str
-            Channel value string
-        """
-        return (channel_value_str.replace(InkMLParser.SINGLE_DIFFERENCE_MODIFIER, '')
-                .replace(InkMLParser.SECOND_DIFFERENCE_MODIFIER, ''))
@@ -50,9 +50,11 @@ class IOTPaperParser(Parser):
     ```
 
     """
-    def parse(self, path_or_stream: Union[str, bytes, memoryview, BytesIO, Path]) -> InkModel:
+
+    @staticmethod
+    def __load_root__(path_or_stream: Union[str, bytes, memoryview, BytesIO, Path]) -> Element:
         """
-        Parse the content of the ink file to the Universal Ink memory model.
+        Parse the XML document of the IOT paper format.
 
         Parameters
         ----------
@@ -61,11 +63,9 @@ class IOTPaperParser(Parser):
 
         Returns
         -------
-           model - `InkModel`
-               Parsed `InkModel` from UIM encoded stream
+           root - `Element`
+               Root element of the document
         """
-        ink_parser: InkMLParser = InkMLParser()
-        ink_parser.cropping_ink = False
         if isinstance(path_or_stream, (str, pathlib.Path)):
             # It's a file path
             with open(path_or_stream, 'r') as inkml_file:
@@ -81,15 +81,31 @@ class IOTPaperParser(Parser):
             root: Element = etree.fromstring(buffer.encode(), parser)
         else:
             root: Element = etree.fromstring(buffer, parser)
+        return root
+
+    def parse(self, path_or_stream: Union[str, bytes, memoryview, BytesIO, Path]) -> InkModel:
+        """
+        Parse the content of the ink file to the Universal Ink memory model.
+
+        Parameters
+        ----------
+        path_or_stream: Union[str, bytes, memoryview, BytesIO, Path]
+            `Path` of file, path as str, stream, or byte array.
 
+        Returns
+        -------
+           model - `InkModel`
+               Parsed `InkModel` from UIM encoded stream
+        """
+        ink_parser: InkMLParser = InkMLParser()
+        ink_parser.cropping_ink = False
+        root: Element = IOTPaperParser.__load_root__(path_or_stream)
         namespaces: Dict[str, str] = {'inkml': 'http://www.w3.org/2003/InkML'}
 
         inkml_element: Optional[Element] = root.find('.//inkml:ink', namespaces)
         if inkml_element is not None:
-            # Step 3: Convert the InkML subtree to a string
-            inkml_string: str = etree.tostring(inkml_element, encoding='unicode')
-            ink_model = ink_parser.parse(inkml_string.encode('utf-8'))
-            return ink_model
+            # The InkML subtree is parsed in place, without serializing it again
+            return ink_parser.parse_element(inkml_element)
         raise FormatException("The IOT paper format contains no ink data")
 
     @staticmethod
@@ -107,21 +123,7 @@ class IOTPaperParser(Parser):
            image_content - bytes
                Template content bytes encoded as BMP from the IOT paper format
         """
-        if isinstance(path_or_stream, (str, pathlib.Path)):
-            # It's a file path
-            with open(path_or_stream, 'r') as inkml_file:
-                buffer = inkml_file.read()
-        else:
-            # It's a buffer
-            if isinstance(path_or_stream, (bytes, memoryview)):
-                path_or_stream = BytesIO(path_or_stream)
-
-            buffer = path_or_stream.read()
-        parser: etree.XMLParser = etree.XMLParser(recover=True)
-        if isinstance(buffer, str):
-            root: Element = etree.fromstring(buffer.encode(), parser)
-        else:
-            root: Element = etree.fromstring(buffer, parser)
+        root: Element = IOTPaperParser.__load_root__(path_or_stream)
         template_image_element: Optional[Element] = root.find('.//templateImage')
 
         if template_image_element is not None:
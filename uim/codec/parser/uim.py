@@ -12,9 +12,9 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import ctypes
 import io
 import logging
+import mmap
 import os
 import struct
 
@@ -23,8 +23,6 @@ from pathlib import Path
 from typing import Tuple, Union
 from uim.codec.base import RIFF_HEADER, UIM_HEADER, HEAD_HEADER
 from uim.codec.parser.base import Parser, FormatException, SupportedFormats
-from uim.codec.parser.decoder.decoder_3_0_0 import UIMDecoder300
-from uim.codec.parser.decoder.decoder_3_1_0 import UIMDecoder310
 from uim.model.ink import InkModel
 
 # Create the Logger
@@ -204,7 +202,7 @@ class UIMParser(Parser):
             raise FormatException('Not an Universal Ink Model File.')
         if stream.read(4) != HEAD_HEADER:
             raise FormatException('Header missing.')
-        size_head = ctypes.c_uint32(int.from_bytes(stream.read(4), byteorder='little')).value
+        size_head = int.from_bytes(stream.read(4), byteorder='little')
         version_major = int.from_bytes(stream.read(1), byteorder='big')
         version_minor = int.from_bytes(stream.read(1), byteorder='big')
         version_patch = int.from_bytes(stream.read(1), byteorder='big')
@@ -247,18 +245,59 @@ class UIMParser(Parser):
             with io.open(path, 'rb') as fp:
                 if json_encoding:
                     logger.debug('JSON decoder chosen.')
+                    # Only the decoder of the version is loaded
+                    from uim.codec.parser.decoder.decoder_3_0_0 import UIMDecoder300
                     # Content parser
                     return UIMDecoder300.decode_json(fp)
         raise ValueError(f"Unsupported format. Type must be str or Path, but is {type(path)}.")
 
-    def parse(self, path_or_stream: Union[str, bytes, memoryview, BytesIO, Path]) -> InkModel:
+    @staticmethod
+    def __parse_riff__(riff: Union[BytesIO, mmap.mmap]) -> InkModel:
+        """
+        Parse the RIFF container of the Universal Ink Model codec.
+
+        Parameters
+        ----------
+        riff: Union[BytesIO, mmap.mmap]
+            Stream positioned at the start of the RIFF container.
+
+        Returns
+        -------
+           model - `InkModel`
+               Parsed `InkModel` from UIM encoded stream
+
+        Raises
+        ------
+        FormatException
+            Raises if the stream is not an UIM stream.
+        """
+        # Read header
+        header: bytes = riff.read(4)
+        # Read the stream
+        if header != RIFF_HEADER:
+            raise FormatException('Stream does not start with RIFF id')
+        # Read package size
+        size_packet: bytes = riff.read(4)
+        riff_size: int = int.from_bytes(size_packet, byteorder='little')
+        logger.debug(f'Data packet size: {riff_size}')
+        size_head, version = UIMParser.__parse_version__(riff)
+        # Only the decoder of the version is loaded
+        if version == SupportedFormats.UIM_VERSION_3_0_0:
+            from uim.codec.parser.decoder.decoder_3_0_0 import UIMDecoder300
+            return UIMDecoder300.decode(riff, size_head)
+        if version == SupportedFormats.UIM_VERSION_3_1_0:
+            from uim.codec.parser.decoder.decoder_3_1_0 import UIMDecoder310
+            return UIMDecoder310.decode(riff, size_head)
+        raise FormatException(f"Parser does not support this format. {version}")
+
+    def parse(self, path_or_stream: Union[str, bytes, memoryview, BytesIO, mmap.mmap, os.PathLike]) -> InkModel:
         """
         Parse the Universal Ink Model codec.
 
         Parameters
         ----------
-        path_or_stream: Union[str, bytes, memoryview, BytesIO, Path]
-            `Path` of file, path as str, stream, or byte array.
+        path_or_stream: Union[str, bytes, memoryview, BytesIO, mmap.mmap, os.PathLike]
+            `Path` of file, path as str, stream, memory-mapped file, or byte array.
 
         Returns
         -------
@@ -272,39 +311,19 @@ class UIMParser(Parser):
         TypeError
             Raises if the type is not supported.
         """
-        if isinstance(path_or_stream, (str, Path)):
+        if isinstance(path_or_stream, (str, os.PathLike)):
             # Check if path does exist
             if not os.path.exists(path_or_stream):
                 raise FormatException(f'UIM file with path: {str(path_or_stream)} does not exist.')
-            # Read file
-            with io.open(path_or_stream, 'rb') as fp:
+            # Map the file, the chunks are paged in on demand instead of reading the whole file
+            with io.open(path_or_stream, 'rb') as fp, Parser.__memory_map__(fp) as riff:
                 logger.debug('RIFF decoder chosen.')
-                riff_file: Chunk = Chunk(fp, bigendian=False)
-                if riff_file.getname() != RIFF_HEADER:
-                    raise FormatException('File does not start with RIFF id')
-                logger.debug(f'Data packet size: {riff_file.getsize()}')
-                riff: BytesIO = BytesIO(riff_file.read())
-                riff_size: int = riff_file.getsize()
+                return UIMParser.__parse_riff__(riff)
+        # Read In-Memory
+        if isinstance(path_or_stream, (bytes, memoryview)):
+            riff: BytesIO = BytesIO(path_or_stream)
+        elif isinstance(path_or_stream, (BytesIO, mmap.mmap)):
+            riff: Union[BytesIO, mmap.mmap] = path_or_stream
         else:
-            # Read In-Memory
-            if isinstance(path_or_stream, (bytes, memoryview)):
-                riff: BytesIO = BytesIO(path_or_stream)
-            elif isinstance(path_or_stream, BytesIO):
-                riff: BytesIO = path_or_stream
-            else:
-                raise TypeError('parse() accepts path (str) or stream (bytes, BytesIO)')
-            # Read header
-            header: bytes = riff.read(4)
-            # Read the stream
-            if header != RIFF_HEADER:
-                raise FormatException('Stream does not start with RIFF id')
-            # Read package size
-            size_packet: bytes = riff.read(4)
-            riff_size: int = ctypes.c_uint32(int.from_bytes(size_packet, byteorder='little')).value
-        logger.debug(f'Data packet size: {riff_size}')
-        size_head, version = UIMParser.__parse_version__(riff)
-        if version == SupportedFormats.UIM_VERSION_3_0_0:
-            return UIMDecoder300.decode(riff, size_head)
-        if version == SupportedFormats.UIM_VERSION_3_1_0:
-            return UIMDecoder310.decode(riff, size_head)
-        raise FormatException(f"Parser does not support this format. {version}")
+            raise TypeError('parse() accepts path (str) or stream (bytes, BytesIO)')
+        return UIMParser.__parse_riff__(riff)
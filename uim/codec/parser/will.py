@@ -12,8 +12,8 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import mmap
 import os
-import pathlib
 import struct
 import time
 import uuid
@@ -33,7 +33,7 @@ from uim.codec.base import WILL_PROTOBUF_ENCODING, RIFF_HEADER
 from uim.codec.format.WILL_2_0_0_pb2 import Path
 from uim.codec.context.version import Version
 from uim.codec.parser.base import Parser, FormatException, SupportedFormats
-from uim.codec.parser.base import Stream, EndOfStream
+from uim.codec.parser.base import Stream
 from uim.model.base import UUIDIdentifier
 from uim.model.ink import InkModel
 from uim.model.inkdata import brush
@@ -135,42 +135,55 @@ class WILL2Parser(Parser):
             stacklevel=2
         )
 
-    def parse(self, path_or_stream: Union[str, bytes, memoryview, BytesIO, Path]) -> InkModel:
+    def parse(self, path_or_stream: Union[str, bytes, memoryview, BytesIO, mmap.mmap, os.PathLike]) -> InkModel:
         """
         Parse the content of a WILL data or file format encoded ink file to the Universal Ink memory model.
 
         Parameters
         ----------
         path_or_stream: Any
-            `Path` of file, path as str, stream, or byte array.
+            `Path` of file, path as str, stream, memory-mapped file, or byte array.
 
         Returns
         -------
            model - `InkModel`
                Parsed `InkModel` from UIM encoded stream
         """
-        # Read the file if path_or_stream is a file path
-        if isinstance(path_or_stream, (str, pathlib.Path)):
-            with open(path_or_stream, mode='rb') as fp:
-                stream: BytesIO = BytesIO(fp.read())
+        # Map the file if path_or_stream is a file path, the pages are loaded on demand
+        if isinstance(path_or_stream, (str, os.PathLike)):
+            with open(path_or_stream, mode='rb') as fp, Parser.__memory_map__(fp) as stream:
+                paths: List = self.__parse_paths__(stream)
         elif isinstance(path_or_stream, (bytes, memoryview)):
-            stream: BytesIO = BytesIO(path_or_stream)
-        elif isinstance(path_or_stream, BytesIO):
-            stream: BytesIO = path_or_stream
+            paths: List = self.__parse_paths__(BytesIO(path_or_stream))
+        elif isinstance(path_or_stream, (BytesIO, mmap.mmap)):
+            paths: List = self.__parse_paths__(path_or_stream)
         else:
             raise TypeError(f'parse() accepts Path, path (str) or stream (bytes, BytesIO), got {type(path_or_stream)}')
 
-        version: Version = WILL2Parser.__get_version_from_stream__(stream)
-        if version == SupportedFormats.WILL_DATA_VERSION_2_0_0:  # Data format
-            paths: List = self.__parse_will_data__(stream)
-        else:  # File codec (OPC)
-            paths = self.__parse_will_file__(stream)
-
         self.__paths = self.__ensure_unique_path_ids__(paths)
         return self.__build_object__()
 
+    def __parse_paths__(self, stream: Union[BytesIO, mmap.mmap]) -> List[Path]:
+        """
+        Parse the paths of either the WILL data format or the WILL file format.
+
+        Parameters
+        ----------
+        stream: Union[BytesIO, mmap.mmap]
+            Stream of the WILL data or file format, positioned at its start
+
+        Returns
+        -------
+        paths: List[Path]
+            Paths encoded in the stream
+        """
+        version: Version = WILL2Parser.__get_version_from_stream__(stream)
+        if version == SupportedFormats.WILL_DATA_VERSION_2_0_0:  # Data format
+            return self.__parse_will_data__(stream)
+        # File codec (OPC)
+        return self.__parse_will_file__(stream)
+
     def __parse_will_data__(self, stream: BytesIO) -> List[Path]:
-        paths: list = []
         riff_chunk: Chunk = Chunk(stream, bigendian=False)
         riff_chunk.read(4)  # skip the WILL chunk name
         head_chunk: Chunk = Chunk(riff_chunk, bigendian=False)
@@ -178,15 +191,9 @@ class WILL2Parser(Parser):
         ink_chunk: Chunk = Chunk(riff_chunk, bigendian=False)
         ink_data: bytes = ink_chunk.read()
         self.__protobuf = ink_data
-        try:
-            for path in self.__parse_protobuf__(Stream(ink_data)):
-                paths.append(path)
-        except EndOfStream:
-            pass
-        return paths
+        return list(self.__parse_protobuf__(Stream(ink_data)))
 
     def __parse_will_file__(self, stream: BytesIO) -> List[Path]:
-        paths: list = []
         try:
             with zipfile.ZipFile(stream) as f:
                 for fname in f.namelist():
@@ -260,11 +267,7 @@ class WILL2Parser(Parser):
 
         except zipfile.BadZipFile as e:
             raise FormatException(e) from e
-        try:
-            for path in self.__parse_protobuf__(Stream(self.__protobuf)):
-                paths.append(path)
-        except EndOfStream:
-            pass
+        paths: List[Path] = list(self.__parse_protobuf__(Stream(self.__protobuf)))
         if len(paths) == 0:
             raise FormatException('No path data found in the WILL file.')
         return paths
@@ -420,10 +423,11 @@ class WILL2Parser(Parser):
 
     @staticmethod
     def __parse_protobuf__(stream: Stream):
-        # Read message length (128 bit varint)
-        while True:
-            message_length: int = WILL2Parser.__decode_varint__(stream).uint
-            message = stream.read(message_length)
+        # Read message length (128 bit varint) until the end of the stream is reached
+        while (message_length_bits := WILL2Parser.__decode_varint__(stream)) is not None:
+            message = stream.read_or_none(message_length_bits.uint)
+            if message is None:
+                return
             path: Path = Path()
             path.ParseFromString(message)
             yield path
@@ -484,12 +488,12 @@ class WILL2Parser(Parser):
         return colors
 
     @staticmethod
-    def __decode_varint__(stream) -> BitArray:
+    def __decode_varint__(stream: Stream) -> Optional[BitArray]:
         bit_array: BitArray = BitArray()
         while True:
-            byte = stream.read(1)
-            if not byte:
-                raise EndOfStream()
+            byte = stream.read_or_none(1)
+            if byte is None:
+                return None
             byte: byte = struct.unpack('B', byte)[0]
             has_more: bool = byte & 0x80  # test most-significant-bit
             bit_array.prepend(BitArray(uint=byte & 0x7F, length=7))
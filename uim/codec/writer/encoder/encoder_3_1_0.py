@@ -675,7 +675,6 @@ class UIMEncoder310(CodecEncoder):
                         properties_map[p_path_point_properties.id] = properties_index
                         properties_index += 1
                         UIMEncoder310.__serialize_properties_data__(p_path_point_properties, ink_data.properties.add())
-                    stroke.propertiesIndex = properties_map[p_path_point_properties.id]
                     path.randomSeed = stroke.style.particles_random_seed
                     path.propertiesIndex = properties_map[p_path_point_properties.id]
                     if stroke.style.brush_uri is not None:
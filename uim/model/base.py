@@ -95,6 +95,7 @@ class Identifier(ABC):
         If identifier is not of type UUID
     """
     SEPARATOR: str = "\n"
+    __slots__ = ('__identifier', '__method')
 
     def __init__(self, identifier: uuid.UUID, method: IdentifiableMethod = IdentifiableMethod.MD5):
         self.__identifier: uuid.UUID = identifier
@@ -256,6 +257,8 @@ class HashIdentifier(Identifier):
         Identifier
     """
 
+    __slots__ = ()
+
     def __init__(self, identifier: Optional[uuid.UUID] = None):
         super().__init__(identifier=identifier, method=IdentifiableMethod.MD5)
 
@@ -309,6 +312,8 @@ class UUIDIdentifier(Identifier):
         Identifier
     """
 
+    __slots__ = ()
+
     def __init__(self, identifier: uuid.UUID):
         super().__init__(identifier=identifier, method=IdentifiableMethod.UUID)
 
@@ -16,7 +16,7 @@ import csv
 import json
 from json import JSONEncoder
 from pathlib import Path
-from typing import Union, Any, Optional, List, Dict
+from typing import Union, Any, Optional, List, Dict, Tuple
 
 from uim.model.base import Identifier
 from uim.model.helpers.policy import HandleMissingDataPolicy
@@ -147,12 +147,14 @@ def serialize_raw_sensor_data_csv(ink_model: InkModel, path: Path, layout: Optio
                 header[i] = f"{sd_type.name} (in {unit_map[sd_type].name})"
 
         csv_writer.writerow(header)
+        # Conversion factors are constant per column, unit2unit(source, target, value) is factor * value
+        conversions: List[Tuple[int, Union[int, float]]] = []
+        if unit_map is not None:
+            for sensor_type in layout:
+                if sensor_type in unit_map:
+                    target: Unit = unit_map[sensor_type]
+                    conversions.append((index_map[sensor_type], unit2unit(si_unit(target), target, 1)))
         for row in sensor_strided_array:
-            if unit_map is not None:
-                for j in range(0, len(layout)):
-                    sensor_type: InkSensorType = layout[j]
-                    value_index: int = index_map[sensor_type]
-                    if sensor_type in unit_map:
-                        target: Unit = unit_map[sensor_type]
-                        row[value_index] = unit2unit(si_unit(target), target, row[value_index])
+            for value_index, factor in conversions:
+                row[value_index] = factor * row[value_index]
             csv_writer.writerow(row)
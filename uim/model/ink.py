@@ -16,7 +16,7 @@ import logging
 import sys
 import uuid
 from abc import ABC
-from typing import List, Any, Dict, Tuple, Optional, Union
+from typing import List, Any, Dict, Tuple, Optional, Union, Iterable
 
 import numpy
 
@@ -878,6 +878,17 @@ class InkModel(ABC):
         """
         self.__knowledge_graph.add_semantic_triple(subject, predicate, obj)
 
+    def add_semantic_triples(self, triples: Iterable[Tuple[str, str, str]]):
+        """Adding several semantic triples to the object at once.
+
+        Parameters
+        ----------
+        triples: Iterable[Tuple[str, str, str]]
+            Triples given as (subject, predicate, object).
+        """
+        self.__knowledge_graph.extend(schema.SemanticTriple(subject, predicate, obj)
+                                      for subject, predicate, obj in triples)
+
     def remove_semantic_triple(self, subject: str, predicate: str, obj: str):
         """Remove a semantic triple from the object.
 
@@ -12,14 +12,13 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import ctypes
 import logging
 import uuid
 from abc import ABC
 from enum import Enum
 from logging import Logger
 from math import isclose
-from typing import Tuple, List, Optional, Dict, Any, Union
+from typing import Tuple, List, Optional, Dict, Any, Union, Callable
 
 import numpy as np
 
@@ -100,6 +99,9 @@ class PathPointProperties(HashIdentifier):
     [2] Ink Designer to configure rendering pipeline: http://ink-designer.trafficmanager.net/
     """
 
+    __slots__ = ('__size', '__red', '__green', '__blue', '__alpha', '__rotation', '__scale_x', '__scale_y', '__scale_z',
+                 '__offset_x', '__offset_y', '__offset_z')
+
     def __init__(self, size: float = 0., red: float = 0., green: float = 0., blue: float = 0., alpha: float = 0.,
                  rotation: float = 0., scale_x: float = 0., scale_y: float = 0., scale_z: float = 0.,
                  offset_x: float = 0., offset_y: float = 0., offset_z: float = 0.):
@@ -169,7 +171,8 @@ class PathPointProperties(HashIdentifier):
         g: int = int(green * 255)
         b: int = int(blue * 255)
         a: int = int(alpha * 255)
-        return ctypes.c_int32((r << 24) | (g << 16) | (b << 8) | a).value
+        # Reinterpret the packed value as signed 32-bit integer, as the protobuf field is a sint32
+        return ((((r << 24) | (g << 16) | (b << 8) | a) + 0x80000000) & 0xFFFFFFFF) - 0x80000000
 
     @property
     def size(self) -> float:
@@ -372,6 +375,8 @@ class Style(ABC):
         Render mode URI
     """
 
+    __slots__ = ('__properties', '__brush_uri', '__particles_random_seed', '__render_mode_URI')
+
     def __init__(self, properties: PathPointProperties = None, brush_uri: str = None, particles_random_seed: int = 0,
                  render_mode_uri: str = BlendModeURIs.SOURCE_OVER):
         self.__properties = properties if properties is not None else PathPointProperties()
@@ -732,6 +737,12 @@ class Stroke(UUIDIdentifier):
     >>> stroke_1: Stroke = Stroke(UUIDIdentifier.id_generator(), spline=spline_1, style=style_1)
     """
 
+    __slots__ = ('__start_parameter', '__end_parameter', '__spline_x', '__spline_y', '__spline_z', '__size',
+                 '__rotation', '__scale_x', '__scale_y', '__scale_z', '__offset_x', '__offset_y', '__offset_z', '__red',
+                 '__green', '__blue', '__alpha', '__tangent_x', '__tangent_y', '__sensor_data_id',
+                 '__sensor_data_offset', '__sensor_data_mapping', '__style', '__random_seed', '__properties_index',
+                 '__timestamp_cache', '__pressure_cache', '__precision_scheme', '__spline_loader')
+
     def __init__(self, sid: uuid.UUID = None, sensor_data_offset: int = None, sensor_data_id: uuid.UUID = None,
                  sensor_data_mapping: list = None, style: Style = None, random_seed: int = 0, property_index: int = 0,
                  spline: Spline = None):
@@ -764,9 +775,46 @@ class Stroke(UUIDIdentifier):
         self.__timestamp_cache: Optional[List[float]] = None
         self.__pressure_cache: Optional[List[float]] = None
         self.__precision_scheme: Optional[PrecisionScheme] = None
+        self.__spline_loader: Optional[Callable[[], Tuple[List[float], ...]]] = None
         if spline is not None:
             self.__import__(spline)
 
+    def __defer_splines__(self, loader: Callable[[], Tuple[List[float], ...]]):
+        """
+        Defer the decoding of the spline values until they are accessed for the first time.
+        Decoders use this to skip the work for strokes that are never read.
+
+        Parameters
+        ----------
+        loader: Callable[[], Tuple[List[float], ...]]
+            Returns the x, y, z, size, rotation, x/y/z scale and x/y/z offset values, in this order.
+        """
+        self.__spline_loader = loader
+
+    def __set_splines__(self, values: Tuple[List[float], ...]):
+        """
+        Set all spline values at once, used by decoders instead of the individual setters.
+
+        Parameters
+        ----------
+        values: Tuple[List[float], ...]
+            The x, y, z, size, rotation, x/y/z scale and x/y/z offset values, in this order.
+        """
+        self.__spline_loader = None
+        self.__spline_x, self.__spline_y, self.__spline_z, self.__size, self.__rotation, self.__scale_x, \
+            self.__scale_y, self.__scale_z, self.__offset_x, self.__offset_y, self.__offset_z = values
+
+    def __load_splines__(self):
+        """
+        Decode deferred spline values, if any.
+        """
+        loader: Optional[Callable[[], Tuple[List[float], ...]]] = self.__spline_loader
+        if loader is not None:
+            # The loader is kept if decoding fails, so the values are not silently lost
+            self.__spline_x, self.__spline_y, self.__spline_z, self.__size, self.__rotation, self.__scale_x, \
+                self.__scale_y, self.__scale_z, self.__offset_x, self.__offset_y, self.__offset_z = loader()
+            self.__spline_loader = None
+
     @property
     def uri(self) -> str:
         """
@@ -826,6 +874,7 @@ class Stroke(UUIDIdentifier):
     @property
     def layout_mask(self) -> int:
         """Layout mask for the stroke. (`int`)"""
+        self.__load_splines__()
         mask: int = 0
         if len(self.__spline_x) > 0:
             mask |= LayoutMask.X.value
@@ -903,10 +952,12 @@ class Stroke(UUIDIdentifier):
     @property
     def sizes(self) -> List[float]:
         """List of size values. (`List[float]`)"""
+        self.__load_splines__()
         return self.__size
 
     @sizes.setter
     def sizes(self, size: list):
+        self.__load_splines__()
         self.__size = size
 
     @property
@@ -948,91 +999,111 @@ class Stroke(UUIDIdentifier):
     @property
     def rotations(self) -> List[float]:
         """List of rotations. (`List[float]`)"""
+        self.__load_splines__()
         return self.__rotation
 
     @rotations.setter
     def rotations(self, values: List[float]):
+        self.__load_splines__()
         self.__rotation = values
 
     @property
     def splines_x(self) -> List[float]:
         """List of splines x. (`List[float]`)"""
+        self.__load_splines__()
         return self.__spline_x
 
     @splines_x.setter
     def splines_x(self, spline_x: List[float]):
+        self.__load_splines__()
         self.__spline_x = spline_x
 
     @property
     def splines_y(self) -> List[float]:
         """List of splines y. (`List[float]`)"""
+        self.__load_splines__()
         return self.__spline_y
 
     @splines_y.setter
     def splines_y(self, spline_y: List[float]):
+        self.__load_splines__()
         self.__spline_y = spline_y
 
     @property
     def splines_z(self) -> List[float]:
         """List of splines z. (`List[float]`)"""
+        self.__load_splines__()
         return self.__spline_z
 
     @splines_z.setter
     def splines_z(self, spline_z: List[float]):
+        self.__load_splines__()
         self.__spline_z = spline_z
 
     @property
     def scales_x(self) -> List[float]:
         """List of x scales. (`List[float]`)"""
+        self.__load_splines__()
         return self.__scale_x
 
     @scales_x.setter
     def scales_x(self, scale: List[float]):
+        self.__load_splines__()
         self.__scale_x = scale
 
     @property
     def scales_y(self) -> List[float]:
         """List of y scales. (`List[float]`)"""
+        self.__load_splines__()
         return self.__scale_y
 
     @scales_y.setter
     def scales_y(self, scale: List[float]):
+        self.__load_splines__()
         self.__scale_y = scale
 
     @property
     def scales_z(self) -> List[float]:
         """List of z scales. (`List[float]`)"""
+        self.__load_splines__()
         return self.__scale_z
 
     @scales_z.setter
     def scales_z(self, scale: list):
+        self.__load_splines__()
         self.__scale_z = scale
 
     @property
     def offsets_x(self) -> List[float]:
         """List of x offsets."""
+        self.__load_splines__()
         return self.__offset_x
 
     @offsets_x.setter
     def offsets_x(self, offset: List[float]):
+        self.__load_splines__()
         self.__offset_x = offset
 
     @property
     def offsets_y(self) -> List[float]:
         """List of y offsets. (`List[float]`)"""
+        self.__load_splines__()
         return self.__offset_y
 
     @offsets_y.setter
     def offsets_y(self, offset: List[float]):
+        self.__load_splines__()
         self.__offset_y = offset
 
     @property
     def offsets_z(self) -> List[float]:
         """List of z offsets. (`List[float]`)"""
+        self.__load_splines__()
         return self.__offset_z
 
     @offsets_z.setter
     def offsets_z(self, offset: List[float]):
+        self.__load_splines__()
         self.__offset_z = offset
 
     @property
@@ -1085,26 +1156,31 @@ class Stroke(UUIDIdentifier):
     @property
     def spline_min_x(self) -> float:
         """Minimum value of x spline. (`float`)"""
+        self.__load_splines__()
         return np.min(self.__spline_x)
 
     @property
     def spline_min_y(self) -> float:
         """Minimum value of y spline. (`float`)"""
+        self.__load_splines__()
         return np.min(self.__spline_y)
 
     @property
     def spline_max_x(self) -> float:
         """Maximum value of x spline. (`float`)"""
+        self.__load_splines__()
         return np.max(self.__spline_x)
 
     @property
     def spline_max_y(self) -> float:
         """Maximum value of y spline. (`float`)"""
+        self.__load_splines__()
         return np.max(self.__spline_y)
 
     @property
     def points_count(self) -> int:
         """Number of points of sample points. (`int`)"""
+        self.__load_splines__()
         return len(self.__spline_x)
 
     @property
@@ -1312,6 +1388,7 @@ class Stroke(UUIDIdentifier):
 
     def __import__(self, spline: Spline):
         # The content from spline is imported with the appropriate Layout mask being set.
+        self.__load_splines__()
         self.__start_parameter = spline.ts
         self.__end_parameter = spline.tf
         idx: int = 0
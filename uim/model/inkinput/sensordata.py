@@ -16,7 +16,7 @@ import logging
 import math
 import uuid
 from enum import Enum
-from typing import List, Union, Optional, Any
+from typing import List, Union, Optional, Any, Tuple
 
 from uim.model.base import UUIDIdentifier
 from uim.model.inkinput.inputdata import InkSensorType, SensorChannel, Unit, unit2unit
@@ -59,6 +59,8 @@ class ChannelData(UUIDIdentifier):
     values:Optional[List[Union[float, int]]] (optional) [default: None]
         List of values. If not provided, an empty list is created.
     """
+    __slots__ = ('__values',)
+
     def __init__(self, sensor_channel_id: uuid.UUID, values: Optional[List[Union[float, int]]] = None):
         super().__init__(sensor_channel_id)
         self.__values: list = values or []
@@ -229,6 +231,41 @@ class SensorData(UUIDIdentifier):
         channel_data: ChannelData = self.get_data_by_id(sensor_channel.id)
         channel_data.values = values
 
+    def add_channels_data(self, channels_data: List[Tuple[SensorChannel, List[float]]]):
+        """
+        Adding the data of several sensor channels at once.
+        Equivalent to calling `add_timestamp_data` for the timestamp channel and `add_data` for all other channels, in
+        the given order, but without the per-call overhead.
+
+        Parameters
+        ----------
+        channels_data: List[Tuple[SensorChannel, List[float]]]
+            Pairs of sensor channel and its list of values.
+
+        Raises
+        ------
+        ValueError:
+            Issue with the parameter
+        """
+        map_channels: dict = self.__map_channels
+        map_idx: dict = self.__map_idx
+        for sensor_channel, values in channels_data:
+            if sensor_channel is None:
+                raise ValueError("Sensor channel is null")
+            if values is None:
+                raise ValueError("Values are null")
+            if len(values) == 0:
+                continue
+            channel_id: uuid.UUID = sensor_channel.id
+            channel: Optional[ChannelData] = map_channels.get(channel_id)
+            if channel is None:
+                map_channels[channel_id] = ChannelData(channel_id, values)
+                map_idx[len(map_channels) - 1] = channel_id
+            else:
+                channel.values = values
+            if sensor_channel.type == InkSensorType.TIMESTAMP:
+                self.__timestamp = round(unit2unit(Unit.S, Unit.MS, values[0]))
+
     def __dict__(self):
         return {
             'id': str(self.id),
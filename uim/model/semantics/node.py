@@ -20,7 +20,7 @@ from typing import List, Any, Optional
 from typing import Tuple
 from uim.codec.parser.base import SupportedFormats
 from uim.model.base import UUIDIdentifier, InkModelException
-from uim.model.semantics.structures import BoundingBox
+from uim.model.semantics.structures import BoundingBox, EMPTY_BOUNDING_BOX
 from uim.model.semantics.schema import CommonViews
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -216,9 +216,7 @@ class InkNode(UUIDIdentifier):
 
     def __init__(self, node_id: uuid.UUID, group_bounding_box: Optional[BoundingBox] = None):
         super(UUIDIdentifier, self).__init__(node_id)
-        self.__group_bounding_box: BoundingBox = group_bounding_box if group_bounding_box else BoundingBox(x=0, y=0,
-                                                                                                           width=0,
-                                                                                                           height=0)
+        self.__group_bounding_box: BoundingBox = group_bounding_box if group_bounding_box else EMPTY_BOUNDING_BOX
         self.__parent: Optional[StrokeGroupNode] = None
         self.__tree: Optional['InkTree'] = None
         self.__transient_tag: Optional[str] = None
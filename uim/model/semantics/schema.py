@@ -15,7 +15,7 @@
 import logging
 from enum import Enum
 from logging import Logger
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Iterable
 
 logger: Logger = logging.getLogger(__name__)
 
@@ -442,6 +442,16 @@ class TripleStore:
         """
         self.__triple_statement.append(triple_statement)
 
+    def extend(self, triple_statements: Iterable[SemanticTriple]):
+        """Appending several triple statements at once.
+
+        Parameters
+        ----------
+        triple_statements: Iterable[SemanticTriple]
+            Triples that need to be added
+        """
+        self.__triple_statement.extend(triple_statements)
+
     def add_semantic_triple(self, subject: str, predicate: str, obj: str):
         """
         Adding a semantic triple.
@@ -99,3 +99,7 @@ class BoundingBox(ABC):
 
     def __repr__(self):
         return f'<Bounding box : [x:={self.x}, y:={self.y}, width:={self.width}, height:={self.height}]>'
+
+
+EMPTY_BOUNDING_BOX: BoundingBox = BoundingBox(0., 0., 0., 0.)
+"""Empty bounding box. `BoundingBox` is read-only, thus this instance is shared by all nodes without bounding box."""